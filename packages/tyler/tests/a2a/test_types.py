@@ -29,8 +29,11 @@ from tyler.a2a.types import (
     tyler_content_to_parts,
     parts_to_tyler_content,
     extract_text_from_parts,
+    to_a2a_part,
+    from_a2a_part,
     MAX_FILE_SIZE_BYTES,
     A2A_PROTOCOL_VERSION,
+    HAS_A2A,
 )
 
 
@@ -118,7 +121,19 @@ class TestFilePart:
         
         expected = base64.b64encode(data).decode("utf-8")
         assert part.to_base64() == expected
-    
+
+    def test_file_part_to_base64_stdlib_fallback(self):
+        """Test Base64 encoding without pybase64 installed."""
+        data = b"Hello, world!"
+        part = FilePart(name="test.txt", media_type="text/plain", file_with_bytes=data)
+
+        with patch("tyler.a2a.types.HAS_PYBASE64", False), \
+             patch("tyler.a2a.types._b64", base64):
+            result = part.to_base64()
+
+        assert isinstance(result, str)
+        assert result == base64.b64encode(data).decode("utf-8")
+
     def test_file_part_to_base64_remote(self):
         """Test Base64 encoding returns None for remote file."""
         part = FilePart(
@@ -141,6 +156,33 @@ class TestFilePart:
         # Backward compat
         assert part.data == original_data
 
+    def test_file_part_from_path_infers_media_type(self, tmp_path):
+        """Test creating FilePart from a path sniffs the MIME type."""
+        png_bytes = b"\x89PNG\r\n\x1a\n" + b"\x00" * 32
+        path = tmp_path / "image.png"
+        path.write_bytes(png_bytes)
+
+        part = FilePart.from_path(path)
+
+        assert part.name == "image.png"
+        assert part.media_type == "image/png"
+        assert part.file_with_bytes == png_bytes
+
+    def test_file_part_from_path_unknown_type(self, tmp_path):
+        """Test unrecognized content falls back to octet-stream."""
+        path = tmp_path / "notes.txt"
+        path.write_bytes(b"plain text")
+
+        part = FilePart.from_path(str(path))
+
+        assert part.media_type == "application/octet-stream"
+        assert part.file_with_bytes == b"plain text"
+
+    def test_file_part_from_path_missing(self, tmp_path):
+        """Test FileNotFoundError for a missing path."""
+        with pytest.raises(FileNotFoundError):
+            FilePart.from_path(tmp_path / "missing.bin")
+
 
 class TestDataPart:
     """Test cases for DataPart (AC-6).
@@ -227,7 +269,7 @@ class TestArtifact:
         
         assert artifact.artifact_id  # Should be auto-generated UUID
         assert artifact.name == "Auto ID Artifact"
-        assert len(artifact.artifact_id) == 36  # UUID format
+        assert len(artifact.artifact_id) == 32  # UUID4 hex format
     
     def test_artifact_with_metadata(self):
         """Test Artifact with metadata."""
@@ -349,7 +391,16 @@ class TestTypeConversion:
         assert result["files"][0]["mime_type"] == "text/plain"
         assert result["files"][0]["file_with_bytes"] == b"content"
         assert result["files"][0]["data"] == b"content"
-    
+
+    def test_parts_to_tyler_content_part_subclass(self):
+        """Test Part subclasses and unknown objects in parts_to_tyler_content."""
+        class CustomTextPart(TextPart):
+            pass
+
+        result = parts_to_tyler_content([CustomTextPart(text="Hi"), object()])
+
+        assert result == {"text": ["Hi"], "files": [], "data": []}
+
     def test_extract_text_from_parts(self):
         """Test extracting text from mixed parts."""
         parts = [
@@ -363,6 +414,55 @@ class TestTypeConversion:
         assert text == "Line 1\nLine 2"
 
 
+@pytest.mark.skipif(not HAS_A2A, reason="a2a-sdk not available")
+class TestA2APartConversion:
+    """Test cases for converting parts to and from A2A SDK types."""
+    
+    def test_text_part_round_trip(self):
+        """Test TextPart converts to the SDK type and back."""
+        a2a_part = to_a2a_part(TextPart(text="Hello"))
+        
+        assert a2a_part.text == "Hello"
+        assert from_a2a_part(a2a_part) == TextPart(text="Hello")
+    
+    def test_inline_file_part_round_trip(self):
+        """Test inline FilePart is Base64 encoded for the SDK."""
+        part = FilePart(name="test.bin", media_type="application/octet-stream", file_with_bytes=b"\x00\x01")
+        
+        a2a_part = to_a2a_part(part)
+        
+        assert a2a_part.file.bytes == base64.b64encode(b"\x00\x01").decode("ascii")
+        assert from_a2a_part(a2a_part) == part
+    
+    def test_remote_file_part_round_trip(self):
+        """Test remote FilePart converts to an SDK FileWithUri."""
+        part = FilePart(name="doc.pdf", media_type="application/pdf", file_with_uri="https://example.com/doc.pdf")
+        
+        a2a_part = to_a2a_part(part)
+        
+        assert a2a_part.file.uri == "https://example.com/doc.pdf"
+        assert from_a2a_part(a2a_part) == part
+    
+    def test_data_part_round_trip(self):
+        """Test DataPart converts to the SDK type and back."""
+        a2a_part = to_a2a_part(DataPart(data={"key": "value"}))
+        
+        assert a2a_part.data == {"key": "value"}
+        assert from_a2a_part(a2a_part).data == {"key": "value"}
+    
+    def test_part_subclass(self):
+        """Test Part subclasses use their base type's converter."""
+        class CustomTextPart(TextPart):
+            pass
+        
+        assert to_a2a_part(CustomTextPart(text="Hi")).text == "Hi"
+    
+    def test_unknown_part_type(self):
+        """Test unknown objects are rejected."""
+        with pytest.raises(ValueError, match="Unknown part type"):
+            to_a2a_part(object())
+
+
 class TestConstants:
     """Test cases for module constants."""
     
@@ -316,7 +316,46 @@ class TestAgentEval:
         assert eval.name == "test_eval"
         assert len(eval.conversations) == 1
         assert len(eval.scorers) == 1
-    
+
+    def test_safe_agent_copied_per_conversation(self, simple_agent):
+        """Test each conversation gets its own agent copy sharing one set of mocks"""
+        def lookup(query: str) -> str:
+            return query
+
+        simple_agent.tools = [lookup]
+        eval = AgentEval(
+            name="test_eval",
+            conversations=[Conversation(id="test1", user="Hello", expect=Expectation(mentions=["hi"]))],
+            scorers=[ToolUsageScorer()]
+        )
+
+        safe_agent = eval._create_safe_agent(simple_agent)
+        other_agent = eval._create_safe_agent(simple_agent)
+
+        assert safe_agent is not simple_agent
+        assert other_agent is not safe_agent
+        assert isinstance(safe_agent.tools[0], MockTool)
+        assert other_agent.tools[0] is safe_agent.tools[0]
+        assert simple_agent.tools == [lookup]
+
+    def test_weave_dataset_and_scorers_cached(self):
+        """Test Weave conversions are reused until the source list is reassigned"""
+        eval = AgentEval(
+            name="test_eval",
+            conversations=[Conversation(id="test1", user="Hello", expect=Expectation(mentions=["hi"]))],
+            scorers=[ToolUsageScorer()]
+        )
+
+        dataset = eval._create_weave_dataset()
+        weave_scorers = eval._create_weave_scorers()
+        assert eval._create_weave_dataset() is dataset
+        assert eval._create_weave_scorers() is weave_scorers
+
+        eval.conversations = [Conversation(id="test2", user="Bye", expect=Expectation(mentions=["bye"]))]
+        new_dataset = eval._create_weave_dataset()
+        assert new_dataset is not dataset
+        assert new_dataset[0]["conversation_id"] == "test2"
+
     @pytest.mark.asyncio
     async def test_agent_eval_with_mocks(self, simple_agent, mock_weave):
         """Test running evaluation with mocked tools"""
@@ -6,9 +6,10 @@ from tyler import Agent, Thread, Message, ThreadStore
 
 from tyler.utils.tool_runner import tool_runner, ToolRunner
 from narrator.database.storage_backend import MemoryBackend
-from narrator import FileStore
+from narrator import FileStore, Attachment
 from openai import OpenAI
 from litellm import ModelResponse
+import asyncio
 import base64
 import os
 import json
@@ -41,6 +42,24 @@ class MockToolCall:
         self.function = SimpleNamespace(name=function_name, arguments=arguments)
 
 
+def make_tool(name, implementation, attributes=None, properties=None):
+    """Build a tool dict for Agent(tools=...); parameters default to a single string 'query'"""
+    tool = {
+        'definition': {
+            'type': 'function',
+            'function': {
+                'name': name,
+                'description': f'{name} tool',
+                'parameters': {'type': 'object', 'properties': properties or {'query': {'type': 'string'}}}
+            }
+        },
+        'implementation': implementation,
+    }
+    if attributes is not None:
+        tool['attributes'] = attributes
+    return tool
+
+
 @pytest.mark.asyncio
 async def test_run_tool_returning_none_is_not_treated_as_missing(agent):
     """A tool may legitimately return None; it should be recorded as TOOL_RESULT, not TOOL_ERROR."""
@@ -320,7 +339,7 @@ async def test_go_no_tool_calls(agent, mock_thread_store, mock_prompt, mock_lite
         assert "metrics" in result.new_messages[0].model_dump()
         assert "timing" in result.new_messages[0].metrics
         assert "usage" in result.new_messages[0].metrics
-        mock_thread_store.save.assert_called_with(result.thread)
+        mock_thread_store.save.assert_called_once_with(result.thread)
         assert agent._iteration_count == 0
 
 @pytest.mark.asyncio
@@ -617,6 +636,53 @@ async def test_get_thread_direct(agent):
     result = await agent._get_thread(thread)
     assert result == thread
 
+
+@pytest.mark.asyncio
+async def test_get_thread_coalesces_concurrent_lookups(agent):
+    """Test that concurrent lookups of the same thread ID share one store call"""
+    thread = Thread(id="test-thread")
+    release = asyncio.Event()
+    calls = []
+
+    async def slow_get(thread_id):
+        calls.append(thread_id)
+        await release.wait()
+        return thread
+
+    agent.thread_store = MagicMock()
+    agent.thread_store.get = slow_get
+
+    lookups = [asyncio.create_task(agent._get_thread("test-thread")) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*lookups)
+
+    # The starter gets the store's object; joiners get their own copies
+    assert results[0] is thread
+    assert all(result == thread and result is not thread for result in results[1:])
+    assert results[1] is not results[2]
+    assert calls == ["test-thread"]
+    assert agent._thread_inflight == {}
+
+    # A later lookup goes back to the store
+    await agent._get_thread("test-thread")
+    assert calls == ["test-thread", "test-thread"]
+
+
+@pytest.mark.asyncio
+async def test_get_thread_single_lookup_returns_store_object(agent):
+    """Test that a lookup with no concurrent callers returns the store's thread without copying"""
+    thread = Thread(id="test-thread")
+    agent.thread_store = MagicMock()
+    agent.thread_store.get = AsyncMock(return_value=thread)
+
+    with patch.object(Thread, "model_copy") as mock_copy:
+        result = await agent._get_thread("test-thread")
+
+    assert result is thread
+    mock_copy.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_get_thread_missing_store(agent):
     """Test getting thread by ID without thread store"""
@@ -1872,6 +1938,23 @@ async def test_gemini_tool_handling(mock_thread_store, mock_file_store):
                             assert 'additionalProperties' not in prop
 
 
+def test_gemini_tools_copy_reused_across_steps():
+    """Test that the Gemini tool rewrite is only recomputed when the tools list changes"""
+    from tyler.models.completion_handler import CompletionHandler
+    handler = CompletionHandler(model_name="gemini-pro")
+    tools = [{'type': 'function', 'function': {'name': 't', 'parameters': {'properties': {'c': {'additionalProperties': True}}}}}]
+
+    first = handler._build_completion_params([], tools, False)["tools"]
+    second = handler._build_completion_params([], tools, False)["tools"]
+    assert first is second
+    assert 'additionalProperties' in tools[0]['function']['parameters']['properties']['c']
+
+    tools.append({'type': 'function', 'function': {'name': 'u'}})
+    third = handler._build_completion_params([], tools, False)["tools"]
+    assert third is not first
+    assert len(third) == 2
+
+
 @pytest.mark.asyncio
 async def test_process_tool_result_with_metrics():
     """Test _process_tool_result helper with different scenarios"""
@@ -2097,4 +2180,460 @@ def test_go_alias_backwards_compatibility():
     # Verify that .go is an alias for .run
     assert agent.go == agent.run
     assert callable(agent.go)
-    assert callable(agent.run) 
\ No newline at end of file
+    assert callable(agent.run)
+
+
+@pytest.mark.asyncio
+async def test_get_completion_exact_cache():
+    """Test that cache_mode='exact' reuses responses for identical requests"""
+    agent = Agent(name="TestAgent", cache_mode="exact")
+    params = {"model": "gpt-4.1", "messages": [{"role": "user", "content": "hi"}], "stream": False}
+
+    usage = SimpleNamespace(completion_tokens=5, prompt_tokens=10, total_tokens=15)
+
+    with patch('tyler.models.agent.acompletion', new_callable=AsyncMock) as mock_completion:
+        mock_completion.side_effect = [
+            MockResponse([MockChoice(MockMessage("a"))], usage=usage),
+            MockResponse([MockChoice(MockMessage("b"))]),
+        ]
+        first = await agent._get_completion(**params)
+        first.choices[0].message.content = "changed by caller"
+        second = await agent._get_completion(**params)
+        third = await agent._get_completion(**{**params, "messages": [{"role": "user", "content": "bye"}]})
+
+    # Hits are copies of the stored response, unaffected by callers changing earlier results
+    assert second is not first
+    assert second.choices[0].message.content == "a"
+    # Cached responses spend no tokens
+    assert first.usage.total_tokens == 15
+    assert (second.usage.prompt_tokens, second.usage.completion_tokens, second.usage.total_tokens) == (0, 0, 0)
+    assert third.choices[0].message.content == "b"
+    assert mock_completion.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_completion_skips_cache_for_unserializable_params():
+    """Test that requests with non-JSON parameters are never served from the cache"""
+    class Opaque:
+        def __str__(self):
+            return "same"
+
+    agent = Agent(name="TestAgent", cache_mode="exact")
+    params = {"model": "gpt-4.1", "messages": [{"role": "user", "content": "hi"}], "stream": False}
+
+    with patch('tyler.models.agent.acompletion', new_callable=AsyncMock) as mock_completion:
+        mock_completion.side_effect = [MockResponse([MockChoice(MockMessage("a"))]), MockResponse([MockChoice(MockMessage("b"))])]
+        first = await agent._get_completion(**params, metadata=Opaque())
+        second = await agent._get_completion(**params, metadata=Opaque())
+
+    assert first.choices[0].message.content == "a"
+    assert second.choices[0].message.content == "b"
+    assert len(agent._completion_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_completion_cache_off_and_streaming():
+    """Test that the cache is bypassed by default and for streaming requests"""
+    params = {"model": "gpt-4.1", "messages": [{"role": "user", "content": "hi"}]}
+
+    with patch('tyler.models.agent.acompletion', new_callable=AsyncMock) as mock_completion:
+        await Agent(name="TestAgent")._get_completion(**params, stream=False)
+        await Agent(name="TestAgent")._get_completion(**params, stream=False)
+        cached_agent = Agent(name="TestAgent", cache_mode="exact")
+        await cached_agent._get_completion(**params, stream=True)
+        await cached_agent._get_completion(**params, stream=True)
+
+    assert mock_completion.await_count == 4
+    assert len(cached_agent._completion_cache) == 0
+
+
+def test_instruction_message_cache_control():
+    """Test that cache_system_prompt adds a cache breakpoint for Anthropic models only"""
+    agent = Agent(name="TestAgent", model_name="anthropic/claude-sonnet-4-5", cache_system_prompt=True)
+    message = agent._build_instruction_message("prompt")
+    assert message["role"] == "system"
+    assert message["content"] == [{"type": "text", "text": "prompt", "cache_control": {"type": "ephemeral"}}]
+
+    openai_agent = Agent(name="TestAgent", model_name="gpt-4.1", cache_system_prompt=True)
+    assert openai_agent._build_instruction_message("prompt") == {"role": "system", "content": "prompt"}
+
+    default_agent = Agent(name="TestAgent", model_name="anthropic/claude-sonnet-4-5")
+    assert default_agent._build_instruction_message("prompt") == {"role": "system", "content": "prompt"}
+
+
+@pytest.mark.asyncio
+async def test_step_respects_max_parallel_tools():
+    """Test that step() never runs more than max_parallel_tools tools at once"""
+    agent = Agent(name="TestAgent", max_parallel_tools=2)
+    thread = Thread()
+    thread.add_message(Message(role="user", content="Test"))
+
+    tool_calls = [MockToolCall(id=f"call_{i}") for i in range(5)]
+    response = MockResponse([MockChoice(MockMessage("", tool_calls=tool_calls))])
+    active = 0
+    peak = 0
+
+    async def fake_tool(tc):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return tc.id
+
+    with patch('tyler.models.agent.acompletion', new_callable=AsyncMock, return_value=response), \
+            patch.object(agent, '_handle_tool_execution', side_effect=fake_tool):
+        _, metrics = await agent.step(thread, execute_tools=True)
+
+    assert peak == 2
+    assert metrics["_tool_execution_results"] == {f"call_{i}": f"call_{i}" for i in range(5)}
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_calls_cancels_tools_when_cancelled():
+    """Test that cancelling tool execution cancels the running tools instead of orphaning them"""
+    agent = Agent(name="TestAgent")
+    started = asyncio.Event()
+    cancelled = []
+
+    async def slow_tool(tc):
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(tc.id)
+            raise
+
+    with patch.object(agent, '_handle_tool_execution', side_effect=slow_tool):
+        task = asyncio.create_task(agent._execute_tool_calls([MockToolCall(id="call_1"), MockToolCall(id="call_2")]))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)
+
+    assert sorted(cancelled) == ["call_1", "call_2"]
+
+
+def test_completion_cache_key_stdlib_fallback():
+    """Test that cache keys are stable with and without orjson installed"""
+    from tyler.utils import hashing
+    from tyler.models.completion_handler import CompletionCache
+    params = {"model": "gpt-4.1", "messages": [{"role": "user", "content": "hi"}], "temperature": 0.7}
+    reordered = {"temperature": 0.7, "messages": [{"content": "hi", "role": "user"}], "model": "gpt-4.1"}
+
+    with patch.object(hashing, "HAS_ORJSON", False):
+        assert CompletionCache.make_key(params) == CompletionCache.make_key(reordered)
+    assert CompletionCache.make_key(params) == CompletionCache.make_key(reordered)
+    assert CompletionCache.make_key(params) != CompletionCache.make_key({**params, "temperature": 0.2})
+
+
+@pytest.mark.asyncio
+async def test_run_background_thread_saves(agent, mock_thread_store):
+    """Test that intermediate saves run in the background and the final save is awaited"""
+    agent.background_thread_saves = True
+    thread = Thread(id="test-conv", title="Test Thread")
+    thread.add_message(Message(role="user", content="Test"))
+
+    tool_call = MockToolCall(id="call_1")
+    responses = [
+        MockResponse([MockChoice(MockMessage("", tool_calls=[tool_call]))]),
+        MockResponse([MockChoice(MockMessage("done"))]),
+    ]
+
+    async def mock_step(*args, **kwargs):
+        return responses.pop(0), {"_tool_execution_results": {"call_1": "ok"}}
+
+    with patch.object(agent, "step", side_effect=mock_step):
+        result = await agent.run(thread)
+
+    assert result.content == "done"
+    # Mid-loop snapshot (user, assistant, tool) followed by the final save of the real thread
+    saved = [call.args[0] for call in mock_thread_store.save.call_args_list]
+    assert len(saved) == 2
+    assert saved[0] is not thread
+    assert len(saved[0].messages) == 3
+    # Only the message list is copied; the messages themselves are shared
+    assert saved[0].messages is not thread.messages
+    assert all(a is b for a, b in zip(saved[0].messages, thread.messages))
+    assert saved[1] is thread
+    assert len(thread.messages) == 4
+
+
+@pytest.mark.asyncio
+async def test_run_background_thread_saves_do_not_block_and_stay_ordered(agent, mock_thread_store):
+    """Test that a slow background save doesn't block later steps and later saves wait for it"""
+    agent.background_thread_saves = True
+    thread = Thread(id="test-conv", title="Test Thread")
+    thread.add_message(Message(role="user", content="Test"))
+
+    responses = [
+        MockResponse([MockChoice(MockMessage("", tool_calls=[MockToolCall(id="call_1")]))]),
+        MockResponse([MockChoice(MockMessage("", tool_calls=[MockToolCall(id="call_1")]))]),
+        MockResponse([MockChoice(MockMessage("done"))]),
+    ]
+    release = asyncio.Event()
+    save_log = []
+
+    async def save(saved_thread):
+        save_log.append(f"start {len(saved_thread.messages)}")
+        if len(save_log) == 1:
+            await release.wait()
+        save_log.append(f"end {len(saved_thread.messages)}")
+
+    async def mock_step(*args, **kwargs):
+        await asyncio.sleep(0)  # Let started background saves run
+        if not responses[1:]:
+            # The first save is still blocked and the second is queued behind it
+            assert save_log == ["start 3"]
+            release.set()
+        return responses.pop(0), {"_tool_execution_results": {"call_1": "ok"}}
+
+    mock_thread_store.save.side_effect = save
+    with patch.object(agent, "step", side_effect=mock_step):
+        result = await agent.run(thread)
+
+    assert result.content == "done"
+    assert save_log == ["start 3", "end 3", "start 5", "end 5", "start 6", "end 6"]
+
+
+@pytest.mark.asyncio
+async def test_run_cancelled_cancels_pending_background_save(agent, mock_thread_store):
+    """Test that cancelling a run doesn't leave its background save running"""
+    agent.background_thread_saves = True
+    thread = Thread(id="test-conv", title="Test Thread")
+    thread.add_message(Message(role="user", content="Test"))
+
+    save_started = asyncio.Event()
+    save_cancelled = asyncio.Event()
+
+    async def save(saved_thread):
+        save_started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            save_cancelled.set()
+            raise
+
+    async def mock_step(*args, **kwargs):
+        await asyncio.sleep(0)  # Let started background saves run
+        if save_started.is_set():
+            await asyncio.Event().wait()
+        return (
+            MockResponse([MockChoice(MockMessage("", tool_calls=[MockToolCall(id="call_1")]))]),
+            {"_tool_execution_results": {"call_1": "ok"}},
+        )
+
+    mock_thread_store.save.side_effect = save
+    with patch.object(agent, "step", side_effect=mock_step):
+        run = asyncio.create_task(agent.run(thread))
+        await asyncio.wait_for(save_started.wait(), timeout=1)
+        await asyncio.sleep(0)
+        run.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await run
+        await asyncio.wait_for(save_cancelled.wait(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_run_background_thread_save_failure_is_logged(agent, mock_thread_store):
+    """Test that a failed background save is logged rather than reported as a completion error"""
+    agent.background_thread_saves = True
+    thread = Thread(id="test-conv", title="Test Thread")
+    thread.add_message(Message(role="user", content="Test"))
+
+    responses = [
+        MockResponse([MockChoice(MockMessage("", tool_calls=[MockToolCall(id="call_1")]))]),
+        MockResponse([MockChoice(MockMessage("done"))]),
+    ]
+
+    async def mock_step(*args, **kwargs):
+        return responses.pop(0), {"_tool_execution_results": {"call_1": "ok"}}
+
+    mock_thread_store.save.side_effect = [RuntimeError("db down"), None]
+    with patch.object(agent, "step", side_effect=mock_step), \
+         patch("tyler.models.agent.logger") as mock_logger:
+        result = await agent.run(thread)
+
+    assert result.content == "done"
+    assert not any("Error during chat completion" in str(m.content) for m in thread.messages)
+    assert "db down" in mock_logger.warning.call_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_run_background_thread_saves_pending_attachments_synchronously(agent, mock_thread_store):
+    """Test that threads with unstored attachments are saved in place instead of as a snapshot"""
+    agent.background_thread_saves = True
+    thread = Thread(id="test-conv", title="Test Thread")
+    thread.add_message(Message(
+        role="user",
+        content="Test",
+        attachments=[Attachment(filename="notes.txt", content=b"hello")],
+    ))
+
+    responses = [
+        MockResponse([MockChoice(MockMessage("", tool_calls=[MockToolCall(id="call_1")]))]),
+        MockResponse([MockChoice(MockMessage("done"))]),
+    ]
+
+    async def mock_step(*args, **kwargs):
+        return responses.pop(0), {"_tool_execution_results": {"call_1": "ok"}}
+
+    with patch.object(agent, "step", side_effect=mock_step):
+        await agent.run(thread)
+
+    saved = [call.args[0] for call in mock_thread_store.save.call_args_list]
+    assert saved == [thread, thread]
+    assert all(s is thread for s in saved)
+
+
+@pytest.mark.asyncio
+async def test_run_fallback_tool_execution_is_concurrent(agent, mock_thread_store):
+    """Test that tools are run concurrently when a patched step() did not execute them"""
+    thread = Thread(id="test-conv", title="Test Thread")
+    thread.add_message(Message(role="user", content="Test"))
+
+    tool_calls = [MockToolCall(id="call_1"), MockToolCall(id="call_2")]
+    responses = [
+        MockResponse([MockChoice(MockMessage("", tool_calls=tool_calls))]),
+        MockResponse([MockChoice(MockMessage("done"))]),
+    ]
+
+    async def mock_step(*args, **kwargs):
+        return responses.pop(0), {}
+
+    active = 0
+    peak = 0
+
+    async def fake_tool(tc):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return f"result {tc.id}"
+
+    with patch.object(agent, "step", side_effect=mock_step), \
+            patch.object(agent, "_handle_tool_execution", side_effect=fake_tool):
+        result = await agent.run(thread)
+
+    assert peak == 2
+    assert [m.content for m in result.new_messages if m.role == "tool"] == ["result call_1", "result call_2"]
+
+
+def test_system_prompt_reflects_tools_list_mutated_in_place():
+    """Test that the tools description is not served stale when the same list is extended"""
+    from tyler.models.agent import AgentPrompt
+    prompt = AgentPrompt()
+    tools = [{"type": "function", "function": {"name": "first_tool", "description": "First"}}]
+
+    assert "first_tool" in prompt.system_prompt("purpose", "Tyler", "gpt-4.1", tools)
+
+    tools.append({"type": "function", "function": {"name": "second_tool", "description": "Second"}})
+    tools.pop(0)
+    updated = prompt.system_prompt("purpose", "Tyler", "gpt-4.1", tools)
+    assert "second_tool" in updated
+    assert "first_tool" not in updated
+
+
+@pytest.mark.asyncio
+async def test_cacheable_tool_results_are_reused():
+    """Test that tools marked cacheable skip re-execution for equivalent arguments"""
+    calls = {"cached": 0, "uncached": 0, "expiring": 0}
+    properties = {'query': {'type': 'string'}, 'limit': {'type': 'integer'}}
+
+    def counted(name):
+        def implementation(query, limit=None):
+            calls[name] += 1
+            return f"{name}: {query}"
+        return implementation
+
+    agent = Agent(
+        name="Tester",
+        model_name="gpt-4.1",
+        tools=[
+            make_tool("cached", counted("cached"), {"cacheable": True}, properties),
+            make_tool("uncached", counted("uncached"), properties=properties),
+            make_tool("expiring", counted("expiring"), {"cacheable": True, "cache_ttl_seconds": 0}, properties),
+        ],
+    )
+
+    def tool_call(name, arguments):
+        return MockToolCall(id=f"call_{name}", function_name=name, arguments=arguments)
+
+    first = await agent._handle_tool_execution(tool_call("cached", '{"query": "x", "limit": 1}'))
+    second = await agent._handle_tool_execution(tool_call("cached", '{"limit": 1,  "query": "x"}'))
+    await agent._handle_tool_execution(tool_call("cached", '{"query": "y", "limit": 1}'))
+    assert first == second == "cached: x"
+    assert calls["cached"] == 2
+
+    for _ in range(2):
+        await agent._handle_tool_execution(tool_call("uncached", '{"query": "x"}'))
+        await agent._handle_tool_execution(tool_call("expiring", '{"query": "x"}'))
+    assert calls["uncached"] == 2
+    assert calls["expiring"] == 2
+
+
+@pytest.mark.asyncio
+async def test_cacheable_tool_results_are_returned_as_copies():
+    """Test that changing a cached tool result doesn't affect later hits"""
+    def lookup(query):
+        return {"query": query, "items": [1, 2]}
+
+    agent = Agent(
+        name="Tester",
+        model_name="gpt-4.1",
+        tools=[make_tool("lookup", lookup, {"cacheable": True})],
+    )
+    tool_call = MockToolCall(id="call_1", function_name="lookup", arguments='{"query": "x"}')
+
+    first = await agent._handle_tool_execution(tool_call)
+    first["items"].append(3)
+    second = await agent._handle_tool_execution(tool_call)
+    second["query"] = "changed"
+    third = await agent._handle_tool_execution(tool_call)
+
+    assert second == {"query": "x", "items": [1, 2]}
+    assert third == {"query": "x", "items": [1, 2]}
+
+
+@pytest.mark.asyncio
+async def test_cacheable_tools_taking_context_are_not_cached():
+    """Test that cacheable tools reading tool context always execute, and cleanup clears the cache"""
+    calls = {"with_ctx": 0, "plain": 0}
+
+    def with_ctx(ctx, query):
+        calls["with_ctx"] += 1
+        return f"{ctx['user_id']}: {query}"
+
+    def plain(query):
+        calls["plain"] += 1
+        return query
+
+    agent = Agent(
+        name="Tester",
+        model_name="gpt-4.1",
+        tools=[
+            make_tool("with_ctx", with_ctx, {"cacheable": True}),
+            make_tool("plain", plain, {"cacheable": True}),
+        ],
+    )
+
+    results = []
+    for user_id in ("alice", "bob"):
+        agent._tool_context = {"user_id": user_id}
+        results.append(await agent._handle_tool_execution(
+            MockToolCall(id="call_ctx", function_name="with_ctx", arguments='{"query": "x"}')
+        ))
+    agent._tool_context = None
+    assert results == ["alice: x", "bob: x"]
+    assert calls["with_ctx"] == 2
+
+    plain_call = MockToolCall(id="call_plain", function_name="plain", arguments='{"query": "x"}')
+    await agent._handle_tool_execution(plain_call)
+    await agent._handle_tool_execution(plain_call)
+    assert calls["plain"] == 1
+
+    await agent.cleanup()
+    await agent._handle_tool_execution(plain_call)
+    assert calls["plain"] == 2
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest.mock import patch, MagicMock, AsyncMock, create_autospec
 from tyler import Agent, Thread, ThreadStore, Message, ExecutionEvent, EventType
@@ -154,6 +155,29 @@ async def test_stream_basic_response():
         assert any(event.type == EventType.MESSAGE_CREATED for event in updates)
         assert any(event.type == EventType.EXECUTION_COMPLETE for event in updates)
 
+@pytest.mark.asyncio
+async def test_stream_chunk_batching():
+    """Test that stream_chunk_batch_size coalesces content deltas without losing text"""
+    agent = Agent(stream=True, stream_chunk_batch_size=2)
+    thread = Thread()
+    thread.add_message(Message(role="user", content="Hello"))
+
+    chunks = [create_streaming_chunk(content=part) for part in ["He", "llo", " the", "re", "!"]]
+
+    mock_weave_call = MagicMock()
+    mock_weave_call.id = "test-weave-id"
+
+    with patch.object(agent, '_get_completion') as mock_get_completion:
+        mock_get_completion.call.return_value = (async_generator(chunks), mock_weave_call)
+
+        updates = [event async for event in agent.stream(thread)]
+
+    content_chunks = [e.data["content_chunk"] for e in updates if e.type == EventType.LLM_STREAM_CHUNK]
+    # Two full batches, then the remainder is flushed when the stream ends
+    assert content_chunks == ["Hello", " there", "!"]
+    response = next(e for e in updates if e.type == EventType.LLM_RESPONSE)
+    assert response.data["content"] == "Hello there!"
+
 @pytest.mark.asyncio
 async def test_stream_with_tool_calls():
     """Test streaming with tool calls"""
@@ -1565,3 +1589,294 @@ async def test_stream_true_backward_compatibility():
         assert all(isinstance(u, ExecutionEvent) for u in updates)
         stream_chunks = [u for u in updates if u.type == EventType.LLM_STREAM_CHUNK]
         assert len(stream_chunks) == 2
+
+
+def test_chunk_accumulator_repeated_tool_call_id_is_not_duplicated():
+    """Test that a tool call id seen again re-selects the existing entry"""
+    from tyler.streaming.base import ChunkAccumulator
+
+    accumulator = ChunkAccumulator()
+    accumulator.process_tool_call_delta({"id": "call_1", "function": {"name": "lookup", "arguments": '{"q": '}})
+    accumulator.process_tool_call_delta({"id": "call_2", "function": {"name": "other", "arguments": "{}"}})
+    accumulator.process_tool_call_delta({"id": "call_1", "function": {"name": "lookup"}})
+    accumulator.process_tool_call_delta({"function": {"arguments": '"x"}'}})
+
+    assert [tc["id"] for tc in accumulator.tool_calls] == ["call_1", "call_2"]
+    assert accumulator.tool_calls[0]["function"]["arguments"] == '{"q": "x"}'
+
+
+def test_chunk_accumulator_reset_forgets_tool_call_ids():
+    """Test that a tool call id reused after reset() is registered again"""
+    from tyler.streaming import ChunkAccumulator
+
+    accumulator = ChunkAccumulator()
+    accumulator.process_tool_call_delta({"id": "call_0", "function": {"name": "lookup", "arguments": "{}"}})
+    accumulator.reset()
+    accumulator.process_tool_call_delta({"id": "call_0", "function": {"name": "other", "arguments": '{"q": 1}'}})
+
+    assert accumulator.has_tool_calls()
+    assert accumulator.tool_calls == [{
+        "id": "call_0",
+        "type": "function",
+        "function": {"name": "other", "arguments": '{"q": 1}'},
+    }]
+
+
+def test_chunk_accumulator_exposes_joined_arguments_per_delta():
+    """Test that tool_calls and tool_args hold the arguments received so far"""
+    from tyler.streaming import ChunkAccumulator
+
+    accumulator = ChunkAccumulator()
+    accumulator.process_tool_call_delta({"id": "call_1", "function": {"name": "lookup", "arguments": '{"q": '}})
+    accumulator.process_tool_call_delta({"function": {"arguments": '"x'}})
+    assert accumulator.tool_args == {"call_1": '{"q": "x'}
+    assert accumulator.tool_calls[0]["function"]["arguments"] == '{"q": "x'
+
+    accumulator.process_tool_call_delta({"function": {"arguments": '"}'}})
+    assert accumulator.tool_args == {"call_1": '{"q": "x"}'}
+    assert accumulator.tool_calls[0]["function"]["arguments"] == '{"q": "x"}'
+
+
+def test_chunk_accumulator_keeps_dict_initial_arguments():
+    """Test that complete dict arguments are not overwritten by later string fragments"""
+    from tyler.streaming import ChunkAccumulator
+
+    accumulator = ChunkAccumulator()
+    accumulator.process_tool_call_delta({"id": "call_1", "function": {"name": "lookup", "arguments": {"q": "x"}}})
+    accumulator.process_tool_call_delta({"function": {"arguments": '{"q": "y"}'}})
+
+    assert accumulator.tool_calls[0]["function"]["arguments"] == {"q": "x"}
+    assert accumulator.tool_args == {"call_1": {"q": "x"}}
+
+
+def test_chunk_accumulator_tool_calls_and_args_are_assignable():
+    """Test that tool_calls and tool_args can be replaced and later fragments build on the new values"""
+    from tyler.streaming import ChunkAccumulator
+
+    accumulator = ChunkAccumulator()
+    accumulator.process_tool_call_delta({"id": "call_1", "function": {"name": "lookup", "arguments": '{"q": '}})
+    accumulator.process_tool_call_delta({"function": {"arguments": '"x'}})
+
+    accumulator.tool_args = {"call_1": '{"q": "y'}
+    replacement = {"id": "call_1", "type": "function", "function": {"name": "lookup", "arguments": '{"q": "y'}}
+    accumulator.tool_calls = [replacement]
+    accumulator.current_tool_call = replacement
+    accumulator.process_tool_call_delta({"function": {"arguments": '"}'}})
+
+    assert accumulator.tool_args == {"call_1": '{"q": "y"}'}
+    assert accumulator.tool_calls == [replacement]
+    assert replacement["function"]["arguments"] == '{"q": "y"}'
+
+    accumulator.tool_calls = []
+    accumulator.tool_args = {}
+    assert not accumulator.has_tool_calls()
+    assert accumulator.tool_args == {}
+
+
+def test_chunk_accumulator_keeps_edits_to_tool_args():
+    """Test that editing the returned tool_args is not overwritten by the next join"""
+    from tyler.streaming import ChunkAccumulator
+
+    accumulator = ChunkAccumulator()
+    accumulator.process_tool_call_delta({"id": "call_1", "function": {"name": "lookup", "arguments": '{"q": '}})
+    accumulator.process_tool_call_delta({"function": {"arguments": '"x'}})
+
+    accumulator.tool_args["call_1"] = '{"q": "z'
+    accumulator.process_tool_call_delta({"function": {"arguments": '"}'}})
+
+    assert accumulator.tool_args == {"call_1": '{"q": "z"}'}
+    assert accumulator.tool_calls[0]["function"]["arguments"] == '{"q": "z"}'
+
+
+@pytest.mark.asyncio
+async def test_stream_tools_start_while_selection_events_are_consumed():
+    """Test that a tool is already running when the consumer handles its TOOL_SELECTED event"""
+    agent = Agent(stream=True)
+    thread = Thread()
+    thread.add_message(Message(role="user", content="Look something up"))
+
+    chunks = [
+        create_streaming_chunk(tool_calls=[{
+            "id": "call_1",
+            "type": "function",
+            "function": {"name": "lookup", "arguments": '{"q": "x"}'}
+        }])
+    ]
+    started = asyncio.Event()
+
+    async def fake_tool_execution(tool_call, progress_callback=None):
+        started.set()
+        return "found"
+
+    with patch.object(agent, '_get_completion') as mock_get_completion, \
+         patch.object(agent, '_handle_tool_execution', side_effect=fake_tool_execution):
+        mock_get_completion.call.return_value = (async_generator(chunks), MagicMock())
+
+        saw_started_on_selection = None
+        async for event in agent.stream(thread):
+            if event.type == EventType.TOOL_SELECTED:
+                # Yield to the loop once, as a consumer doing I/O would
+                await asyncio.sleep(0)
+                saw_started_on_selection = started.is_set()
+
+    assert saw_started_on_selection is True
+
+
+@pytest.mark.asyncio
+async def test_stream_background_thread_saves():
+    """Test that intermediate streaming saves run in the background and the final save is awaited"""
+    saved = []
+
+    async def slow_save(thread):
+        await asyncio.sleep(0.01)
+        saved.append((thread, len(thread.messages)))
+
+    mock_thread_store = MagicMock(spec=ThreadStore)
+    mock_thread_store.save = slow_save
+
+    agent = Agent(stream=True, thread_store=mock_thread_store, background_thread_saves=True)
+    thread = Thread()
+    thread.add_message(Message(role="user", content="Look something up"))
+
+    steps = [
+        [create_streaming_chunk(tool_calls=[{
+            "id": "call_1",
+            "type": "function",
+            "function": {"name": "lookup", "arguments": "{}"}
+        }])],
+        [create_streaming_chunk(content="done")],
+    ]
+
+    async def fake_tool_execution(tool_call, progress_callback=None):
+        return "found"
+
+    with patch.object(agent, '_get_completion') as mock_get_completion, \
+         patch.object(agent, '_handle_tool_execution', side_effect=fake_tool_execution):
+        mock_get_completion.call.side_effect = lambda *args, **kwargs: (async_generator(steps.pop(0)), MagicMock())
+
+        updates = [event async for event in agent.stream(thread)]
+
+    assert updates[-1].type == EventType.EXECUTION_COMPLETE
+    # Snapshot after the tool step (user, assistant, tool), then the final save of the real thread
+    assert [count for _, count in saved] == [3, 4]
+    assert saved[0][0] is not thread
+    assert saved[1][0] is thread
+
+
+@pytest.mark.asyncio
+async def test_stream_thread_savers_keep_pending_saves_separate():
+    """Test that two streams on one agent each wait only for their own background save"""
+    from tyler.streaming.core import StreamThreadSaver
+
+    release = asyncio.Event()
+    saved = []
+
+    async def save(thread):
+        if thread.id == "slow":
+            await release.wait()
+        saved.append(thread.id)
+
+    mock_thread_store = MagicMock(spec=ThreadStore)
+    mock_thread_store.save = save
+    agent = Agent(stream=True, thread_store=mock_thread_store, background_thread_saves=True)
+
+    slow_saver = StreamThreadSaver(agent, background=True)
+    fast_saver = StreamThreadSaver(agent, background=True)
+    await slow_saver.save(Thread(id="slow"), intermediate=True)
+    await fast_saver.save(Thread(id="fast"), intermediate=True)
+
+    # The second stream's final save doesn't wait on (or consume) the first stream's pending save
+    await asyncio.wait_for(fast_saver.save(Thread(id="fast")), timeout=1)
+    assert saved == ["fast", "fast"]
+
+    release.set()
+    await slow_saver.save(Thread(id="slow"))
+    assert saved == ["fast", "fast", "slow", "slow"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["events", "openai", "vercel", "vercel_objects"])
+async def test_stream_closed_cancels_pending_background_save(mode):
+    """Test that closing a stream doesn't leave its background save running"""
+    save_started = asyncio.Event()
+    save_cancelled = asyncio.Event()
+
+    async def save(thread):
+        save_started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            save_cancelled.set()
+            raise
+
+    mock_thread_store = MagicMock(spec=ThreadStore)
+    mock_thread_store.save = save
+    agent = Agent(stream=True, thread_store=mock_thread_store, background_thread_saves=True)
+    thread = Thread()
+    thread.add_message(Message(role="user", content="Look something up"))
+
+    steps = [
+        [create_streaming_chunk(tool_calls=[{
+            "id": "call_1",
+            "type": "function",
+            "function": {"name": "lookup", "arguments": "{}"}
+        }])],
+        [create_streaming_chunk(content="done")],
+    ]
+
+    async def fake_tool_execution(tool_call, progress_callback=None):
+        return "found"
+
+    async def consume_until_save_started(stream):
+        async for _ in stream:
+            await asyncio.sleep(0)  # Let the background save start
+            if save_started.is_set():
+                break
+
+    with patch.object(agent, '_get_completion') as mock_get_completion, \
+         patch.object(agent, '_handle_tool_execution', side_effect=fake_tool_execution):
+        mock_get_completion.call.side_effect = lambda *args, **kwargs: (async_generator(steps.pop(0)), MagicMock())
+
+        stream = agent.stream(thread, mode=mode)
+        await asyncio.wait_for(consume_until_save_started(stream), timeout=1)
+        await stream.aclose()
+
+    await asyncio.wait_for(save_cancelled.wait(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_stream_tool_results_reported_as_tools_finish():
+    """Test that a fast tool's result is streamed before a slower tool's"""
+    agent = Agent(stream=True)
+    thread = Thread()
+    thread.add_message(Message(role="user", content="Run both"))
+
+    chunks = [
+        create_streaming_chunk(tool_calls=[
+            {"id": "call_slow", "type": "function", "function": {"name": "slow", "arguments": "{}"}},
+        ]),
+        create_streaming_chunk(tool_calls=[
+            {"id": "call_fast", "type": "function", "function": {"name": "fast", "arguments": "{}"}},
+        ]),
+    ]
+
+    async def fake_tool_execution(tool_call, progress_callback=None):
+        if tool_call["function"]["name"] == "slow":
+            await asyncio.sleep(0.05)
+        return tool_call["function"]["name"]
+
+    steps = [chunks, [create_streaming_chunk(content="done")]]
+
+    with patch.object(agent, '_get_completion') as mock_get_completion, \
+         patch.object(agent, '_handle_tool_execution', side_effect=fake_tool_execution):
+        mock_get_completion.call.side_effect = lambda *args, **kwargs: (async_generator(steps.pop(0)), MagicMock())
+
+        results = []
+        async for event in agent.stream(thread):
+            if event.type == EventType.TOOL_RESULT:
+                results.append(event.data["tool_call_id"])
+
+    assert results == ["call_fast", "call_slow"]
+    # The thread keeps tool messages in request order regardless of finish order
+    tool_call_ids = [m.tool_call_id for m in thread.messages if m.role == "tool"]
+    assert tool_call_ids == ["call_slow", "call_fast"]
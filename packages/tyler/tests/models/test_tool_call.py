@@ -4,7 +4,8 @@ import json
 from tyler.models.tool_call import (
     ToolCall, 
     normalize_tool_calls, 
-    serialize_tool_calls
+    serialize_tool_calls,
+    loads_tool_arguments,
 )
 
 
@@ -439,3 +440,22 @@ class TestRoundTripConversion:
         # Arguments should match
         assert deserialized.arguments == complex_args
 
+
+class TestLoadsToolArguments:
+    """Test loads_tool_arguments() decoding."""
+
+    def test_matches_stdlib_json(self):
+        """Test that decoding matches json.loads for str and bytes input."""
+        raw = '{"query": "caf\u00e9", "limit": 5, "tags": ["a", "b"], "nested": {"x": null}}'
+        assert loads_tool_arguments(raw) == json.loads(raw)
+        assert loads_tool_arguments(raw.encode()) == json.loads(raw)
+
+    def test_accepts_inputs_stdlib_accepts(self):
+        """Test that non-standard values accepted by json.loads still parse."""
+        result = loads_tool_arguments('{"value": NaN}')
+        assert result["value"] != result["value"]
+
+    def test_invalid_json_raises_json_decode_error(self):
+        """Test that invalid JSON raises json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            loads_tool_arguments('{"broken": ')
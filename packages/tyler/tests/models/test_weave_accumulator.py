@@ -9,7 +9,7 @@ content and thinking tokens across all streaming modes:
 - vercel_objects: Dict chunks with "type" key
 """
 from types import SimpleNamespace
-from tyler.models.agent import _weave_stream_accumulator
+from tyler.models.agent import Agent, _weave_stream_accumulator, _weave_stream_summary
 from tyler.models.execution import ExecutionEvent, EventType
 from datetime import datetime, timezone
 
@@ -912,3 +912,56 @@ class TestStepBoundaryReset:
         assert state["events"]["counts"]["tool_selected"] == 1
         assert state["events"]["counts"]["tool_result"] == 1
         assert state["events"]["counts"]["iteration_start"] == 1
+
+
+# =============================================================================
+# Finalizer Tests
+# =============================================================================
+
+class TestStreamSummary:
+    """Tests for _weave_stream_summary, the postprocess_output of the streaming ops."""
+
+    def test_summary_has_plain_string_content_and_thinking(self):
+        """Test that the logged content and thinking are plain strings."""
+        state = None
+        for chunk in ("Hello", ", ", "world!"):
+            state = _weave_stream_accumulator(state, {"type": "text-delta", "delta": chunk})
+        state = _weave_stream_accumulator(state, {"type": "reasoning-delta", "delta": "Hmm"})
+
+        summary = _weave_stream_summary(state)
+
+        assert type(summary["content"]) is str
+        assert type(summary["thinking"]) is str
+        assert summary["content"] == "Hello, world!"
+        assert summary["thinking"] == "Hmm"
+
+    def test_summary_drops_internal_keys(self):
+        """Test that internal bookkeeping keys are not logged."""
+        state = _weave_stream_accumulator(None, {"type": "text-delta", "delta": "Hi"})
+        assert "_step_finished" in state
+
+        summary = _weave_stream_summary(state)
+
+        assert not any(key.startswith("_") for key in summary)
+        assert summary["mode"] == "vercel_objects"
+
+    def test_summary_does_not_mutate_state(self):
+        """Test that finalizing leaves the accumulator state usable."""
+        state = _weave_stream_accumulator(None, {"type": "text-delta", "delta": "A"})
+        _weave_stream_summary(state)
+
+        state = _weave_stream_accumulator(state, {"type": "text-delta", "delta": "B"})
+
+        assert "_step_finished" in state
+        assert state["content"] == "AB"
+        assert _weave_stream_summary(state)["content"] == "AB"
+
+    def test_summary_passes_through_non_dict_output(self):
+        """Test that an output that isn't an accumulated state is returned unchanged."""
+        assert _weave_stream_summary(None) is None
+        assert _weave_stream_summary("text") == "text"
+
+    def test_streaming_ops_log_the_summary(self):
+        """Test that both streaming ops finalize their output with the summary."""
+        assert Agent.stream.postprocess_output is _weave_stream_summary
+        assert Agent.step_stream.postprocess_output is _weave_stream_summary
@@ -7,6 +7,7 @@ The implementation uses an output-tool pattern where the structured
 output schema is registered as a special tool that the model calls
 when ready to provide its final answer.
 """
+import asyncio
 import pytest
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -429,6 +430,96 @@ class TestStructuredOutputWithTools:
                 
                 # Regular tool should have been called
                 assert mock_tool.called
+
+    @pytest.mark.asyncio
+    async def test_regular_tool_calls_run_concurrently(self, thread):
+        """Test that several regular tool calls in one turn execute concurrently."""
+        agent = Agent(
+            name="test-agent",
+            model_name="gpt-4.1",
+            purpose="Test with tools"
+        )
+
+        tool_call_response = MagicMock()
+        tool_call_response.choices = [MagicMock()]
+        tool_call_response.choices[0].message.content = ""
+        tool_calls = []
+        for call_id in ("call_slow", "call_fast"):
+            tool_call = MagicMock()
+            tool_call.id = call_id
+            tool_call.type = "function"
+            tool_call.function = MagicMock()
+            tool_call.function.name = "lookup"
+            tool_call.function.arguments = "{}"
+            tool_calls.append(tool_call)
+        tool_call_response.choices[0].message.tool_calls = tool_calls
+
+        valid_data = {"invoice_id": "INV-001", "total": 100.0, "items": ["A"], "paid": False}
+        output_response = create_output_tool_response("Invoice", valid_data)
+
+        both_started = asyncio.Event()
+        started = []
+
+        async def handle_tool(tool_call):
+            started.append(tool_call.id)
+            if len(started) == 2:
+                both_started.set()
+            # Deadlocks (and times out) if the tools run one at a time
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            if tool_call.id == "call_slow":
+                await asyncio.sleep(0.01)
+            return f"result for {tool_call.id}"
+
+        with patch.object(agent, 'step', new_callable=AsyncMock) as mock_step:
+            mock_step.side_effect = [
+                (tool_call_response, {"usage": {}}),
+                (output_response, {"usage": {}})
+            ]
+            with patch.object(agent, '_handle_tool_execution', side_effect=handle_tool):
+                result = await agent.run(thread, response_type=Invoice)
+
+        assert isinstance(result.structured_data, Invoice)
+        # Tool messages keep the order the model requested them in
+        tool_messages = [m for m in thread.messages if m.role == "tool" and m.name == "lookup"]
+        assert [m.tool_call_id for m in tool_messages] == ["call_slow", "call_fast"]
+
+    @pytest.mark.asyncio
+    async def test_regular_tool_calls_without_id_still_run(self, thread):
+        """Test that a regular tool call without an id is executed and gets its own result."""
+        agent = Agent(
+            name="test-agent",
+            model_name="gpt-4.1",
+            purpose="Test with tools"
+        )
+
+        id_less_call = {"type": "function", "function": {"name": "lookup", "arguments": "{}"}}
+        tool_call_response = MagicMock()
+        tool_call_response.choices = [MagicMock()]
+        tool_call_response.choices[0].message.content = ""
+        tool_call_response.choices[0].message.tool_calls = [id_less_call]
+
+        valid_data = {"invoice_id": "INV-001", "total": 100.0, "items": ["A"], "paid": False}
+        output_response = create_output_tool_response("Invoice", valid_data)
+
+        processed = []
+
+        def process_tool_result(result, tool_call, tool_name):
+            processed.append((result, tool_call, tool_name))
+            return Message(role="tool", name=tool_name, content=str(result), tool_call_id="call_generated"), False
+
+        with patch.object(agent, 'step', new_callable=AsyncMock) as mock_step:
+            mock_step.side_effect = [
+                (tool_call_response, {"usage": {}}),
+                (output_response, {"usage": {}})
+            ]
+            with patch.object(agent, '_handle_tool_execution', new_callable=AsyncMock) as mock_handle, \
+                    patch.object(agent, '_process_tool_result', side_effect=process_tool_result):
+                mock_handle.return_value = "looked up"
+                result = await agent.run(thread, response_type=Invoice)
+
+        assert isinstance(result.structured_data, Invoice)
+        mock_handle.assert_awaited_once_with(id_less_call)
+        assert processed == [("looked up", id_less_call, "lookup")]
     
     @pytest.mark.asyncio
     async def test_output_tool_passed_to_step(self, thread):
@@ -499,6 +590,26 @@ class TestStructuredOutputWithTools:
         assert "Structured project rule." in captured_system_prompt[0]
         assert "structured_output_instruction" in captured_system_prompt[0]
 
+    def test_output_tool_schema_is_generated_once_per_type(self):
+        """The output tool schema is cached per response type; callers get copies."""
+        from tyler.models.agent import _build_output_tool
+
+        _build_output_tool.cache_clear()
+        agent = Agent(
+            name="test-agent",
+            model_name="gpt-4.1",
+            purpose="Test output tool caching"
+        )
+
+        with patch.object(SupportTicket, 'model_json_schema', wraps=SupportTicket.model_json_schema) as mock_schema:
+            first = agent._create_output_tool(SupportTicket)
+            first["function"]["parameters"]["title"] = "mutated"
+            second = agent._create_output_tool(SupportTicket)
+
+        assert mock_schema.call_count == 1
+        assert second["function"]["name"] == "__SupportTicket_output__"
+        assert second["function"]["parameters"]["title"] == "SupportTicket"
+
 
 class TestStructuredOutputValidation:
     """Tests for validation and edge cases."""
@@ -0,0 +1,34 @@
+import datetime
+from unittest.mock import patch
+
+from tyler.utils import hashing
+from tyler.utils.hashing import stable_json_hash
+
+
+def test_stable_json_hash_ignores_key_order():
+    """Test that equal JSON data hashes the same regardless of key order"""
+    value = {"b": [1, {"y": 2, "x": 1}], "a": "text"}
+    reordered = {"a": "text", "b": [1, {"x": 1, "y": 2}]}
+
+    assert stable_json_hash(value) == stable_json_hash(reordered)
+    with patch.object(hashing, "HAS_ORJSON", False):
+        assert stable_json_hash(value) == stable_json_hash(reordered)
+    assert stable_json_hash(value) != stable_json_hash({**value, "a": "other"})
+
+
+def test_stable_json_hash_rejects_non_json_values():
+    """Test that values which aren't plain JSON data get no hash"""
+    class Opaque:
+        def __str__(self):
+            return "same"
+
+    assert stable_json_hash({"value": Opaque()}) is None
+    assert stable_json_hash({"value": datetime.datetime(2024, 1, 1)}) is None
+    with patch.object(hashing, "HAS_ORJSON", False):
+        assert stable_json_hash({"value": Opaque()}) is None
+
+
+def test_stable_json_hash_handles_large_integers():
+    """Test that integers outside orjson's 64-bit range still hash"""
+    assert stable_json_hash({"value": 2 ** 70}) is not None
+    assert stable_json_hash({"value": 2 ** 70}) != stable_json_hash({"value": 2 ** 71})
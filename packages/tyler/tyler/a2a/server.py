@@ -123,7 +123,7 @@ class TylerTaskExecution:
     status: str = "running"
     created_at: datetime = None
     updated_at: datetime = None
-    result_messages: List[str] = None
+    result_messages: List[str] = None  # Content of each assistant message produced by the task
     context_id: Optional[str] = None
     artifacts: List[Artifact] = None
     
@@ -131,7 +131,7 @@ class TylerTaskExecution:
         if self.created_at is None:
             self.created_at = datetime.now(timezone.utc)
         if self.updated_at is None:
-            self.updated_at = datetime.now(timezone.utc)
+            self.updated_at = self.created_at
         if self.result_messages is None:
             self.result_messages = []
         if self.artifacts is None:
@@ -207,20 +207,22 @@ class TylerAgentExecutor(AgentExecutor):
             ))
             
             # Execute with streaming - SDK handles delivery mode
-            artifact_id = str(uuid.uuid4())
-            content_buffer = []
+            # Chunks are forwarded as they arrive; only counters are kept so
+            # memory stays bounded regardless of response size.
+            artifact_id = uuid.uuid4().hex
             chunk_count = 0
+            total_bytes = 0
             artifact_initialized = False
             
-            logger.debug(f"Starting execution for task {task_id}")
+            logger.debug("Starting execution for task %s", task_id)
             
             async for event in self.agent.stream(tyler_thread):
                 if event.type == EventType.LLM_STREAM_CHUNK:
                     # Emit token chunk as artifact update
                     chunk = event.data.get("content_chunk", "")
                     if chunk:
-                        content_buffer.append(chunk)
                         chunk_count += 1
+                        total_bytes += len(chunk)
                         
                         # First chunk creates the artifact (append=False)
                         # Subsequent chunks append to it (append=True)
@@ -241,10 +243,17 @@ class TylerAgentExecutor(AgentExecutor):
                             lastChunk=False,
                         ))
                         
+                elif event.type == EventType.MESSAGE_CREATED:
+                    # Keep each assistant message's final content (one entry per
+                    # step, not per chunk) as the task's result
+                    message = event.data.get("message")
+                    if message is not None and message.role == "assistant" and message.content:
+                        execution.result_messages.append(message.content)
+                        
                 elif event.type == EventType.EXECUTION_ERROR:
                     # Handle error during execution
                     error_msg = event.data.get("message", "Unknown error")
-                    logger.error(f"Execution error for task {task_id}: {error_msg}")
+                    logger.error("Execution error for task %s: %s", task_id, error_msg)
                     
                     await event_queue.enqueue_event(TaskStatusUpdateEvent(
                         taskId=task_id,
@@ -252,7 +261,7 @@ class TylerAgentExecutor(AgentExecutor):
                         status=TaskStatus(
                             state=TaskState.failed,
                             message=Message(
-                                messageId=str(uuid.uuid4()),
+                                messageId=uuid.uuid4().hex,
                                 role=Role.agent,
                                 parts=[Part(root=TextPart(text=f"Task failed: {error_msg}"))],
                                 contextId=context_id,
@@ -268,7 +277,7 @@ class TylerAgentExecutor(AgentExecutor):
                     
                 elif event.type == EventType.EXECUTION_COMPLETE:
                     # Execution complete
-                    logger.debug(f"Execution complete for task {task_id}: {chunk_count} chunks")
+                    logger.debug("Execution complete for task %s: %d chunks", task_id, chunk_count)
                     break
             
             # Send final artifact event with lastChunk=True
@@ -314,16 +323,13 @@ class TylerAgentExecutor(AgentExecutor):
             
             # Update execution record and clean up to prevent memory leak
             execution.status = "completed"
-            execution.result_messages = content_buffer
             execution.updated_at = datetime.now(timezone.utc)
             del self._active_executions[task_id]
             
-            total_bytes = sum(len(c) for c in content_buffer)
-            logger.info(f"Completed task {task_id}: {chunk_count} chunks, {total_bytes} bytes")
+            logger.info("Completed task %s: %d chunks, %d bytes", task_id, chunk_count, total_bytes)
             
         except Exception as e:
-            import traceback
-            logger.error(f"Error executing Tyler task {task_id}: {e}\n{traceback.format_exc()}")
+            logger.error("Error executing Tyler task %s: %s", task_id, e, exc_info=True)
             
             # Send error status
             await event_queue.enqueue_event(TaskStatusUpdateEvent(
@@ -332,7 +338,7 @@ class TylerAgentExecutor(AgentExecutor):
                 status=TaskStatus(
                     state=TaskState.failed,
                     message=Message(
-                        messageId=str(uuid.uuid4()),
+                        messageId=uuid.uuid4().hex,
                         role=Role.agent,
                         parts=[Part(root=TextPart(text=f"Task failed: {str(e)}"))],
                         contextId=context_id,
@@ -366,7 +372,7 @@ class TylerAgentExecutor(AgentExecutor):
             final=True,
         ))
         
-        logger.info(f"Cancelled Tyler task {task_id}")
+        logger.info("Cancelled Tyler task %s", task_id)
     
     def _extract_message_content(self, message: Message) -> str:
         """Extract text content from an A2A message.
@@ -400,7 +406,7 @@ class TylerAgentExecutor(AgentExecutor):
                     data_references.append(f"[Data ({internal_part.media_type}):\n{data_str}\n]")
                     
             except Exception as e:
-                logger.warning(f"Error processing message part: {e}")
+                logger.warning("Error processing message part: %s", e)
                 content_parts.append(str(part))
         
         all_content = content_parts + file_references + data_references
@@ -459,7 +465,7 @@ class A2AServer:
         self._push_sender: Optional[TylerPushNotificationSender] = None
         self._app: Optional[FastAPI] = None
         
-        logger.info(f"A2A server initialized for agent '{getattr(agent, 'name', 'Tyler Agent')}'")
+        logger.info("A2A server initialized for agent '%s'", getattr(agent, 'name', 'Tyler Agent'))
         
     def _create_agent_card(
         self,
@@ -599,9 +605,9 @@ class A2AServer:
                 title=f"{self._agent_card.name} A2A Server",
             )
             
-            logger.info(f"Starting A2A server for '{self._agent_card.name}' on {host}:{port}")
-            logger.info(f"Agent card available at: http://{host}:{port}/.well-known/agent.json")
-            logger.info(f"Push notifications: enabled (SDK-managed)")
+            logger.info("Starting A2A server for '%s' on %s:%s", self._agent_card.name, host, port)
+            logger.info("Agent card available at: http://%s:%s/.well-known/agent.json", host, port)
+            logger.info("Push notifications: enabled (SDK-managed)")
             
             # Start the server
             import uvicorn
@@ -615,7 +621,7 @@ class A2AServer:
             await server.serve()
             
         except Exception as e:
-            logger.error(f"Failed to start A2A server: {e}")
+            logger.error("Failed to start A2A server: %s", e)
             raise
     
     async def stop_server(self) -> None:
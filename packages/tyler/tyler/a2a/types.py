@@ -4,16 +4,17 @@ This module provides type definitions and conversion utilities for A2A Protocol
 Part types (TextPart, FilePart, DataPart) and Artifacts.
 """
 
-import base64
 import logging
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 from urllib.parse import urlparse
 
+import filetype
+
 try:
     from a2a.types import (
         TextPart as A2ATextPart,
@@ -36,12 +37,21 @@ except ImportError:
     A2AFileWithBytes = None
     A2AFileWithUri = None
 
+# pybase64 is an optional SIMD-accelerated drop-in for the stdlib codec,
+# used for inline file payloads when installed
+try:
+    import pybase64 as _b64
+    HAS_PYBASE64 = True
+except ImportError:
+    import base64 as _b64
+    HAS_PYBASE64 = False
+
 logger = logging.getLogger(__name__)
 
 
 # Constants
 MAX_FILE_SIZE_BYTES = 10 * 1024 * 1024  # 10 MB default limit
-ALLOWED_URI_SCHEMES = {"https"}  # Only HTTPS for security
+ALLOWED_URI_SCHEMES = frozenset({"https"})  # Only HTTPS for security
 A2A_PROTOCOL_VERSION = "0.3.0"  # A2A Protocol version supported
 
 
@@ -52,7 +62,7 @@ class PartType(Enum):
     DATA = "data"
 
 
-@dataclass
+@dataclass(slots=True)
 class FilePart:
     """Represents a file part in an A2A message.
     
@@ -110,12 +120,15 @@ class FilePart:
         """Convert inline data to Base64 string."""
         if self.file_with_bytes is None:
             return None
-        return base64.b64encode(self.file_with_bytes).decode("utf-8")
+        if HAS_PYBASE64:
+            # Encodes straight to str without an intermediate bytes copy
+            return _b64.b64encode_as_string(self.file_with_bytes)
+        return _b64.b64encode(self.file_with_bytes).decode("ascii")
     
     @classmethod
     def from_base64(cls, name: str, media_type: str, base64_data: str) -> "FilePart":
         """Create FilePart from Base64 encoded string."""
-        data = base64.b64decode(base64_data)
+        data = _b64.b64decode(base64_data)
         return cls(name=name, media_type=media_type, file_with_bytes=data)
     
     @classmethod
@@ -125,19 +138,19 @@ class FilePart:
         if not path.exists():
             raise FileNotFoundError(f"File not found: {path}")
         
-        # Infer MIME type if not provided
-        if media_type is None:
-            import filetype
-            kind = filetype.guess(str(path))
-            media_type = kind.mime if kind else "application/octet-stream"
-        
         with open(path, "rb") as f:
             data = f.read()
         
+        # Infer MIME type if not provided, sniffing the header of the bytes
+        # already read rather than opening the file a second time
+        if media_type is None:
+            kind = filetype.guess(data)
+            media_type = kind.mime if kind else "application/octet-stream"
+        
         return cls(name=path.name, media_type=media_type, file_with_bytes=data)
 
 
-@dataclass
+@dataclass(slots=True)
 class DataPart:
     """Represents structured JSON data in an A2A message.
     
@@ -172,7 +185,7 @@ class TaskState(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class Artifact:
     """Represents a tangible output produced by an agent during task processing.
     
@@ -214,7 +227,7 @@ class Artifact:
     ) -> "Artifact":
         """Create a new artifact with auto-generated ID."""
         return cls(
-            artifact_id=str(uuid.uuid4()),
+            artifact_id=uuid.uuid4().hex,
             name=name,
             parts=parts,
             created_at=datetime.now(timezone.utc),
@@ -243,7 +256,7 @@ class Artifact:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class TextPart:
     """Represents plain text content in an A2A message.
     
@@ -290,6 +303,44 @@ def tyler_content_to_parts(
         return [TextPart(text=str(content))]
 
 
+def _add_text_content(part: TextPart, result: Dict[str, Any]) -> None:
+    result["text"].append(part.text)
+
+
+def _add_file_content(part: FilePart, result: Dict[str, Any]) -> None:
+    result["files"].append({
+        "name": part.name,
+        "media_type": part.media_type,
+        "mime_type": part.media_type,  # Alias for backward compat
+        "file_with_bytes": part.file_with_bytes,
+        "data": part.file_with_bytes,  # Alias for backward compat
+        "file_with_uri": part.file_with_uri,
+        "uri": part.file_with_uri,  # Alias for backward compat
+        "is_inline": part.file_with_bytes is not None,
+    })
+
+
+def _add_data_content(part: DataPart, result: Dict[str, Any]) -> None:
+    result["data"].append(part.data)
+
+
+# Exact-type dispatch for parts_to_tyler_content; one dict lookup per part
+# instead of a chain of isinstance checks
+_TYLER_CONTENT_HANDLERS = {
+    TextPart: _add_text_content,
+    FilePart: _add_file_content,
+    DataPart: _add_data_content,
+}
+
+
+def _resolve_part_handler(part: Any, handlers: Dict[type, Callable]) -> Optional[Callable]:
+    """Find the handler for a Part subclass in a dispatch table (slow path)."""
+    for part_type, handler in handlers.items():
+        if isinstance(part, part_type):
+            return handler
+    return None
+
+
 def parts_to_tyler_content(
     parts: List[Union[TextPart, FilePart, DataPart]]
 ) -> Dict[str, Any]:
@@ -307,22 +358,11 @@ def parts_to_tyler_content(
         "data": [],
     }
     
+    handlers = _TYLER_CONTENT_HANDLERS
     for part in parts:
-        if isinstance(part, TextPart):
-            result["text"].append(part.text)
-        elif isinstance(part, FilePart):
-            result["files"].append({
-                "name": part.name,
-                "media_type": part.media_type,
-                "mime_type": part.media_type,  # Alias for backward compat
-                "file_with_bytes": part.file_with_bytes,
-                "data": part.file_with_bytes,  # Alias for backward compat
-                "file_with_uri": part.file_with_uri,
-                "uri": part.file_with_uri,  # Alias for backward compat
-                "is_inline": part.is_inline,
-            })
-        elif isinstance(part, DataPart):
-            result["data"].append(part.data)
+        handler = handlers.get(type(part)) or _resolve_part_handler(part, handlers)
+        if handler is not None:
+            handler(part, result)
     
     return result
 
@@ -338,15 +378,45 @@ def extract_text_from_parts(
     Returns:
         Concatenated text content
     """
-    texts = []
-    for part in parts:
-        if isinstance(part, TextPart):
-            texts.append(part.text)
-    return "\n".join(texts) if texts else ""
+    return "\n".join([part.text for part in parts if isinstance(part, TextPart)])
 
 
 # A2A SDK conversion utilities
 
+def _text_part_to_a2a(part: TextPart) -> Any:
+    return A2ATextPart(text=part.text)
+
+
+def _file_part_to_a2a(part: FilePart) -> Any:
+    if part.file_with_bytes is not None:
+        # A2A SDK uses nested FileWithBytes for inline files
+        file_obj = A2AFileWithBytes(
+            bytes=part.to_base64(),
+            mimeType=part.media_type,
+            name=part.name,
+        )
+    else:
+        # A2A SDK uses nested FileWithUri for remote files
+        file_obj = A2AFileWithUri(
+            uri=part.file_with_uri,
+            mimeType=part.media_type,
+            name=part.name,
+        )
+    return A2AFilePart(file=file_obj)
+
+
+def _data_part_to_a2a(part: DataPart) -> Any:
+    return A2ADataPart(data=part.data)
+
+
+# Exact-type dispatch for to_a2a_part
+_TO_A2A_CONVERTERS = {
+    TextPart: _text_part_to_a2a,
+    FilePart: _file_part_to_a2a,
+    DataPart: _data_part_to_a2a,
+}
+
+
 def to_a2a_part(part: Union[TextPart, FilePart, DataPart]) -> Any:
     """Convert internal Part to A2A SDK Part.
     
@@ -366,32 +436,10 @@ def to_a2a_part(part: Union[TextPart, FilePart, DataPart]) -> Any:
     if not HAS_A2A:
         raise ImportError("a2a-sdk is required for A2A support")
     
-    if isinstance(part, TextPart):
-        return A2ATextPart(text=part.text)
-    
-    elif isinstance(part, FilePart):
-        if part.is_inline:
-            # A2A SDK uses nested FileWithBytes for inline files
-            file_obj = A2AFileWithBytes(
-                bytes=part.to_base64(),
-                mimeType=part.media_type,
-                name=part.name,
-            )
-            return A2AFilePart(file=file_obj)
-        else:
-            # A2A SDK uses nested FileWithUri for remote files
-            file_obj = A2AFileWithUri(
-                uri=part.file_with_uri,
-                mimeType=part.media_type,
-                name=part.name,
-            )
-            return A2AFilePart(file=file_obj)
-    
-    elif isinstance(part, DataPart):
-        return A2ADataPart(data=part.data)
-    
-    else:
+    converter = _TO_A2A_CONVERTERS.get(type(part)) or _resolve_part_handler(part, _TO_A2A_CONVERTERS)
+    if converter is None:
         raise ValueError(f"Unknown part type: {type(part)}")
+    return converter(part)
 
 
 def from_a2a_part(a2a_part: Any) -> Union[TextPart, FilePart, DataPart]:
@@ -438,7 +486,7 @@ def from_a2a_part(a2a_part: Any) -> Union[TextPart, FilePart, DataPart]:
             if file_bytes:
                 # Decode Base64
                 if isinstance(file_bytes, str):
-                    file_bytes = base64.b64decode(file_bytes)
+                    file_bytes = _b64.b64decode(file_bytes)
                 return FilePart(
                     name=name,
                     media_type=media_type,
@@ -463,7 +511,7 @@ def from_a2a_part(a2a_part: Any) -> Union[TextPart, FilePart, DataPart]:
         file_bytes = getattr(a2a_part, 'fileWithBytes', None) or getattr(a2a_part, 'data', None)
         if file_bytes:
             if isinstance(file_bytes, str):
-                file_bytes = base64.b64decode(file_bytes)
+                file_bytes = _b64.b64decode(file_bytes)
             return FilePart(name=name, media_type=media_type, file_with_bytes=file_bytes)
         
         file_uri = getattr(a2a_part, 'fileWithUri', None) or getattr(a2a_part, 'uri', None)
@@ -522,11 +570,16 @@ def from_a2a_artifact(a2a_artifact: Any) -> Artifact:
     if not HAS_A2A:
         raise ImportError("a2a-sdk is required for A2A support")
     
+    # Only read the clock when the SDK artifact carries no timestamp
+    created_at = getattr(a2a_artifact, 'created_at', None)
+    if created_at is None:
+        created_at = datetime.now(timezone.utc)
+    
     return Artifact(
         artifact_id=a2a_artifact.artifact_id,
         name=a2a_artifact.name,
         parts=[from_a2a_part(p) for p in a2a_artifact.parts],
-        created_at=getattr(a2a_artifact, 'created_at', datetime.now(timezone.utc)),
+        created_at=created_at,
         metadata=getattr(a2a_artifact, 'metadata', None),
     )
 
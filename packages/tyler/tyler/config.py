@@ -45,6 +45,13 @@ model_name: "gpt-4.1"
 temperature: 0.7
 max_tool_iterations: 10
 
+# Performance Configuration
+# cache_mode: "exact"  # Reuse responses for identical non-streaming requests (default: "off"; streaming is never cached)
+# cache_system_prompt: true  # Add a prompt-cache breakpoint to the system prompt (Anthropic models only)
+# max_parallel_tools: 4  # Cap concurrent tool calls per model response (default: null = no limit)
+# background_thread_saves: true  # Save between tool steps without blocking; a crash can lose the last step's save
+# stream_chunk_batch_size: 4  # Merge this many content deltas into one LLM_STREAM_CHUNK event when streaming (default: 1)
+
 # Instruction Configuration
 # AGENTS.md is auto-discovered by default from the config directory upward.
 # Set agents_md: false to disable, or provide explicit path(s).
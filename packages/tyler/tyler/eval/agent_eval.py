@@ -3,7 +3,6 @@ from typing import List, Optional, Union, Dict, Any
 from datetime import datetime, UTC
 import weave
 from weave import Evaluation
-import copy
 
 from tyler import Agent
 from .conversations import Conversation
@@ -48,6 +47,13 @@ class AgentEval:
         # Store results during evaluation
         self._current_results = []
         
+        # (original tools list, mock tools) reused across conversations in a run
+        self._mock_tools = None
+        
+        # Weave dataset/scorer conversions, reused across runs
+        self._weave_dataset = None
+        self._weave_scorers = None
+        
         # Validate conversations
         if not conversations:
             raise ValueError("Must provide at least one conversation")
@@ -57,30 +63,51 @@ class AgentEval:
             raise ValueError("Must provide at least one scorer")
     
     def _create_weave_dataset(self) -> List[Dict[str, Any]]:
-        """Convert conversations to Weave dataset format"""
-        dataset = []
-        for conv in self.conversations:
-            dataset.append(conv.to_dict())
+        """Convert conversations to Weave dataset format.
+        
+        Cached across runs; rebuilt only if ``conversations`` is reassigned.
+        """
+        cached = self._weave_dataset
+        if cached is not None and cached[0] is self.conversations:
+            return cached[1]
+        dataset = [conv.to_dict() for conv in self.conversations]
+        self._weave_dataset = (self.conversations, dataset)
         return dataset
     
     def _create_weave_scorers(self) -> List:
-        """Convert scorers to Weave scorer functions"""
-        return [scorer.to_weave_scorer() for scorer in self.scorers]
+        """Convert scorers to Weave scorer functions.
+        
+        Cached across runs; rebuilt only if ``scorers`` is reassigned.
+        """
+        cached = self._weave_scorers
+        if cached is not None and cached[0] is self.scorers:
+            return cached[1]
+        weave_scorers = [scorer.to_weave_scorer() for scorer in self.scorers]
+        self._weave_scorers = (self.scorers, weave_scorers)
+        return weave_scorers
     
     def _create_safe_agent(self, agent: Agent) -> Agent:
-        """Create a copy of the agent with mocked tools if needed"""
+        """Create a copy of the agent with mocked tools if needed.
+        
+        Each conversation gets its own copy, since the agent keeps per-run
+        state on itself and Weave runs predictions concurrently. The mock
+        tool list is built once per run and shared, since the mocks come
+        from the shared registry anyway.
+        """
         if not self.use_mock_tools:
             return agent
-            
-        # Create a copy of the agent with mocked tools
-        safe_agent = copy.copy(agent)
         
-        # Replace tools with mocks
+        # Shallow pydantic copy with tools replaced by mocks
+        update = {}
         if hasattr(agent, 'tools') and agent.tools:
-            mock_tools = self.mock_registry.get_mock_tools(agent.tools)
-            safe_agent.tools = mock_tools
-            
-        return safe_agent
+            cached = self._mock_tools
+            if cached is not None and cached[0] is agent.tools:
+                mock_tools = cached[1]
+            else:
+                mock_tools = self.mock_registry.get_mock_tools(agent.tools)
+                self._mock_tools = (agent.tools, mock_tools)
+            update["tools"] = list(mock_tools)
+        return agent.model_copy(update=update)
     
     async def _run_single_conversation(self, 
                                      agent: Agent, 
@@ -110,9 +137,15 @@ class AgentEval:
         # Run agent on the thread
         result = await safe_agent.go(thread)
         
-        # Extract agent response
-        agent_messages = [m for m in result.new_messages if m.role == "assistant"]
-        if not agent_messages:
+        # Extract agent response and the message transcript in a single pass
+        last_message = None
+        all_messages = []
+        for m in result.new_messages:
+            all_messages.append({"role": m.role, "content": m.content})
+            if m.role == "assistant":
+                last_message = m
+        
+        if last_message is None:
             return {
                 "content": "",
                 "tool_calls": [],
@@ -120,13 +153,11 @@ class AgentEval:
                 "mock_tools_used": self.use_mock_tools
             }
         
-        last_message = agent_messages[-1]
-        
         # Format response for scorers
         response = {
             "content": last_message.content or "",
             "tool_calls": last_message.tool_calls or [],
-            "all_messages": [{"role": m.role, "content": m.content} for m in result.new_messages],
+            "all_messages": all_messages,
             "thread_id": result.thread.id,
             "mock_tools_used": self.use_mock_tools
         }
@@ -193,6 +224,7 @@ class AgentEval:
             
             # Clear previous results
             self._current_results = []
+            self._mock_tools = None
             
             # Create Weave evaluation
             dataset = self._create_weave_dataset()
@@ -5,7 +5,7 @@ from pydantic import BaseModel, Field, PrivateAttr
 import json
 import types
 import logging
-from typing import List, Dict, Any, Optional, Union, AsyncGenerator, Tuple, Callable, Awaitable, Literal, Type
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Union, AsyncGenerator, Tuple, Callable, Awaitable, Literal, Type
 from datetime import datetime, timezone
 from litellm import acompletion
 
@@ -22,9 +22,238 @@ from tyler.models.tool_manager import ToolManager
 from tyler.models.skill import SkillManager
 from tyler.models.agents_md import load_agents_md
 from tyler.models.message_factory import MessageFactory
-from tyler.models.completion_handler import CompletionHandler
+from tyler.models.completion_handler import CompletionHandler, CompletionCache
+from tyler.models.tool_call import loads_tool_arguments
+from tyler.models.tool_result_cache import ToolResultCache
 from tyler.tracing.weave_agents import WeaveAgentsTracer
 import asyncio
+import contextlib
+import copy
+import functools
+import time
+
+if TYPE_CHECKING:
+    from tyler.streaming.core import StreamThreadSaver
+
+logger = logging.getLogger(__name__)
+
+
+class _StreamText:
+    """Append-only text that reads like the ``str`` of its joined chunks.
+
+    ``+=`` appends a chunk in O(1) instead of copying the text so far; the
+    chunks are joined lazily on the first read after an append.
+    """
+
+    __slots__ = ("_parts", "_text")
+    __hash__ = None  # Mutable
+
+    def __init__(self) -> None:
+        self._parts: List[str] = []
+        self._text = ""
+
+    def __iadd__(self, chunk: Any) -> "_StreamText":
+        self._parts.append(str(chunk))
+        return self
+
+    def __str__(self) -> str:
+        if self._parts:
+            self._text = "".join([self._text, *self._parts])
+            self._parts = []
+        return self._text
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, _StreamText):
+            other = str(other)
+        if not isinstance(other, str):
+            return NotImplemented
+        return str(self) == other
+
+    def __len__(self) -> int:
+        return len(str(self))
+
+    def __contains__(self, item: str) -> bool:
+        return item in str(self)
+
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+
+def _new_weave_stream_state() -> dict:
+    """Create an empty Weave stream summary."""
+    return {
+        "mode": None,
+        "content": _StreamText(),
+        "thinking": _StreamText(),
+        "events": {"counts": {}},
+        "tools": [],
+        "errors": [],
+        "metrics": {},
+        "_step_finished": False,  # Internal: tracks OpenAI mode step boundaries
+    }
+
+
+def _reset_step_content(state: dict) -> None:
+    """Reset content and thinking for a new step (last step output only)."""
+    state["content"] = _StreamText()
+    state["thinking"] = _StreamText()
+
+
+def _weave_stream_summary(state: Any) -> Any:
+    """Finalize an accumulated Weave stream state into its logged summary.
+
+    Converts the ``content``/``thinking`` buffers to plain strings and drops
+    internal bookkeeping keys. Does not mutate ``state``.
+    """
+    if not isinstance(state, dict):
+        return state
+    summary = {k: v for k, v in state.items() if not k.startswith("_")}
+    for key in ("content", "thinking"):
+        if isinstance(summary.get(key), _StreamText):
+            summary[key] = str(summary[key])
+    return summary
+
+
+# --- Events mode handlers: (state, event data) ---
+
+def _on_event_content_chunk(state: dict, data: dict) -> None:
+    chunk = data.get("content_chunk")
+    if chunk:
+        state["content"] += str(chunk)
+
+
+def _on_event_thinking_chunk(state: dict, data: dict) -> None:
+    chunk = data.get("thinking_chunk")
+    if chunk:
+        state["thinking"] += str(chunk)
+
+
+def _on_event_tool_selected(state: dict, data: dict) -> None:
+    state["tools"].append(
+        {
+            "tool_name": data.get("tool_name"),
+            "tool_call_id": data.get("tool_call_id"),
+            "arguments": data.get("arguments"),
+            "status": "selected",
+        }
+    )
+
+
+def _on_event_tool_result(state: dict, data: dict) -> None:
+    state["tools"].append(
+        {
+            "tool_name": data.get("tool_name"),
+            "tool_call_id": data.get("tool_call_id"),
+            "result": data.get("result"),
+            "duration_ms": data.get("duration_ms"),
+            "status": "result",
+        }
+    )
+
+
+def _on_event_tool_error(state: dict, data: dict) -> None:
+    state["errors"].append(
+        {
+            "tool_name": data.get("tool_name"),
+            "tool_call_id": data.get("tool_call_id"),
+            "error": data.get("error"),
+        }
+    )
+
+
+def _on_event_llm_response(state: dict, data: dict) -> None:
+    metrics = state["metrics"]
+    tokens = data.get("tokens")
+    if isinstance(tokens, dict) and tokens:
+        metrics["tokens"] = tokens
+    latency = data.get("latency_ms")
+    if latency is not None:
+        metrics["latency_ms"] = latency
+    if data.get("tool_calls") is not None:
+        metrics["tool_calls"] = data.get("tool_calls")
+
+
+def _on_event_execution_complete(state: dict, data: dict) -> None:
+    if "duration_ms" in data:
+        state["metrics"]["duration_ms"] = data.get("duration_ms")
+    if "total_tokens" in data:
+        state["metrics"]["total_tokens"] = data.get("total_tokens")
+
+
+_WEAVE_EVENT_HANDLERS: Dict[str, Callable[[dict, dict], None]] = {
+    "llm_stream_chunk": _on_event_content_chunk,
+    "llm_thinking_chunk": _on_event_thinking_chunk,
+    "tool_selected": _on_event_tool_selected,
+    "tool_result": _on_event_tool_result,
+    "tool_error": _on_event_tool_error,
+    "llm_response": _on_event_llm_response,
+    "execution_complete": _on_event_execution_complete,
+}
+
+
+# --- Vercel handlers (SSE and object modes share chunk shapes): (state, chunk) ---
+
+def _on_vercel_text_delta(state: dict, chunk: dict) -> None:
+    delta = chunk.get("delta", "")
+    if delta:
+        state["content"] += str(delta)
+
+
+def _on_vercel_reasoning_delta(state: dict, chunk: dict) -> None:
+    delta = chunk.get("delta", "")
+    if delta:
+        state["thinking"] += str(delta)
+
+
+def _on_vercel_tool_input(state: dict, chunk: dict) -> None:
+    state["tools"].append({
+        "tool_name": chunk.get("toolName"),
+        "tool_call_id": chunk.get("toolCallId"),
+        "arguments": chunk.get("input"),
+        "status": "selected",
+    })
+
+
+def _on_vercel_tool_output(state: dict, chunk: dict) -> None:
+    state["tools"].append({
+        "tool_call_id": chunk.get("toolCallId"),
+        "result": chunk.get("output"),
+        "status": "result",
+    })
+
+
+def _on_vercel_tool_error(state: dict, chunk: dict) -> None:
+    state["errors"].append({
+        "tool_call_id": chunk.get("toolCallId"),
+        "error": chunk.get("errorText"),
+    })
+
+
+def _on_vercel_error(state: dict, chunk: dict) -> None:
+    state["errors"].append({
+        "error": chunk.get("errorText"),
+    })
+
+
+_WEAVE_VERCEL_HANDLERS: Dict[str, Callable[[dict, dict], None]] = {
+    "text-delta": _on_vercel_text_delta,
+    "reasoning-delta": _on_vercel_reasoning_delta,
+    "tool-input-available": _on_vercel_tool_input,
+    "tool-output-available": _on_vercel_tool_output,
+    "tool-output-error": _on_vercel_tool_error,
+    "error": _on_vercel_error,
+}
+
+
+def _accumulate_vercel_chunk(state: dict, chunk: dict) -> None:
+    chunk_type = chunk.get("type")
+    # Reset content/thinking on new step (start-step)
+    if chunk_type == "start-step":
+        _reset_step_content(state)
+        return
+    handler = _WEAVE_VERCEL_HANDLERS.get(chunk_type)
+    if handler is not None:
+        handler(state, chunk)
 
 
 def _weave_stream_accumulator(state: Any | None, value: Any) -> dict:
@@ -38,25 +267,7 @@ def _weave_stream_accumulator(state: Any | None, value: Any) -> dict:
     errors, and metrics continue accumulating for full observability.
     """
     if state is None or not isinstance(state, dict):
-        state = {
-            "mode": None,
-            "content": "",
-            "thinking": "",
-            "events": {"counts": {}},
-            "tools": [],
-            "errors": [],
-            "metrics": {},
-            "_step_finished": False,  # Internal: tracks OpenAI mode step boundaries
-        }
-
-    def _bump(event_name: str) -> None:
-        counts = state.setdefault("events", {}).setdefault("counts", {})
-        counts[event_name] = int(counts.get(event_name, 0)) + 1
-    
-    def _reset_step_content() -> None:
-        """Reset content and thinking for a new step (last step output only)."""
-        state["content"] = ""
-        state["thinking"] = ""
+        state = _new_weave_stream_state()
 
     # --- Events mode (Tyler ExecutionEvent) ---
     if hasattr(value, "type") and hasattr(value, "data"):
@@ -66,65 +277,17 @@ def _weave_stream_accumulator(state: Any | None, value: Any) -> dict:
             event_type = "unknown"
 
         state["mode"] = state.get("mode") or "events"
-        _bump(event_type)
+        counts = state["events"]["counts"]
+        counts[event_type] = counts.get(event_type, 0) + 1
         
         # Reset content/thinking on new step (ITERATION_START)
         if event_type == "iteration_start":
-            _reset_step_content()
+            _reset_step_content(state)
             return state
 
-        data = getattr(value, "data", {}) or {}
-
-        if event_type == "llm_stream_chunk":
-            chunk = data.get("content_chunk")
-            if chunk:
-                state["content"] = (state.get("content") or "") + str(chunk)
-        elif event_type == "llm_thinking_chunk":
-            chunk = data.get("thinking_chunk")
-            if chunk:
-                state["thinking"] = (state.get("thinking") or "") + str(chunk)
-        elif event_type == "tool_selected":
-            state.setdefault("tools", []).append(
-                {
-                    "tool_name": data.get("tool_name"),
-                    "tool_call_id": data.get("tool_call_id"),
-                    "arguments": data.get("arguments"),
-                    "status": "selected",
-                }
-            )
-        elif event_type == "tool_result":
-            state.setdefault("tools", []).append(
-                {
-                    "tool_name": data.get("tool_name"),
-                    "tool_call_id": data.get("tool_call_id"),
-                    "result": data.get("result"),
-                    "duration_ms": data.get("duration_ms"),
-                    "status": "result",
-                }
-            )
-        elif event_type == "tool_error":
-            state.setdefault("errors", []).append(
-                {
-                    "tool_name": data.get("tool_name"),
-                    "tool_call_id": data.get("tool_call_id"),
-                    "error": data.get("error"),
-                }
-            )
-        elif event_type == "llm_response":
-            tokens = data.get("tokens")
-            if isinstance(tokens, dict) and tokens:
-                state.setdefault("metrics", {})["tokens"] = tokens
-            latency = data.get("latency_ms")
-            if latency is not None:
-                state.setdefault("metrics", {})["latency_ms"] = latency
-            if data.get("tool_calls") is not None:
-                state.setdefault("metrics", {})["tool_calls"] = data.get("tool_calls")
-        elif event_type == "execution_complete":
-            if "duration_ms" in data:
-                state.setdefault("metrics", {})["duration_ms"] = data.get("duration_ms")
-            if "total_tokens" in data:
-                state.setdefault("metrics", {})["total_tokens"] = data.get("total_tokens")
-
+        handler = _WEAVE_EVENT_HANDLERS.get(event_type)
+        if handler is not None:
+            handler(state, getattr(value, "data", {}) or {})
         return state
 
     # --- Vercel SSE mode (string chunks like "data: {...}\n\n") ---
@@ -134,44 +297,7 @@ def _weave_stream_accumulator(state: Any | None, value: Any) -> dict:
             # Parse JSON from SSE format: "data: {...}\n\n"
             json_str = value[6:].strip()  # Remove "data: " prefix
             if json_str and json_str != "[DONE]":
-                chunk = json.loads(json_str)
-                chunk_type = chunk.get("type")
-                
-                # Reset content/thinking on new step (start-step)
-                if chunk_type == "start-step":
-                    _reset_step_content()
-                    return state
-                
-                if chunk_type == "text-delta":
-                    delta = chunk.get("delta", "")
-                    if delta:
-                        state["content"] = (state.get("content") or "") + str(delta)
-                elif chunk_type == "reasoning-delta":
-                    delta = chunk.get("delta", "")
-                    if delta:
-                        state["thinking"] = (state.get("thinking") or "") + str(delta)
-                elif chunk_type == "tool-input-available":
-                    state.setdefault("tools", []).append({
-                        "tool_name": chunk.get("toolName"),
-                        "tool_call_id": chunk.get("toolCallId"),
-                        "arguments": chunk.get("input"),
-                        "status": "selected",
-                    })
-                elif chunk_type == "tool-output-available":
-                    state.setdefault("tools", []).append({
-                        "tool_call_id": chunk.get("toolCallId"),
-                        "result": chunk.get("output"),
-                        "status": "result",
-                    })
-                elif chunk_type == "tool-output-error":
-                    state.setdefault("errors", []).append({
-                        "tool_call_id": chunk.get("toolCallId"),
-                        "error": chunk.get("errorText"),
-                    })
-                elif chunk_type == "error":
-                    state.setdefault("errors", []).append({
-                        "error": chunk.get("errorText"),
-                    })
+                _accumulate_vercel_chunk(state, json.loads(json_str))
         except (json.JSONDecodeError, ValueError):
             pass  # Skip malformed SSE chunks
         
@@ -180,44 +306,7 @@ def _weave_stream_accumulator(state: Any | None, value: Any) -> dict:
     # --- Vercel objects mode (dict chunks with "type" key) ---
     if isinstance(value, dict) and "type" in value:
         state["mode"] = state.get("mode") or "vercel_objects"
-        chunk_type = value.get("type")
-        
-        # Reset content/thinking on new step (start-step)
-        if chunk_type == "start-step":
-            _reset_step_content()
-            return state
-        
-        if chunk_type == "text-delta":
-            delta = value.get("delta", "")
-            if delta:
-                state["content"] = (state.get("content") or "") + str(delta)
-        elif chunk_type == "reasoning-delta":
-            delta = value.get("delta", "")
-            if delta:
-                state["thinking"] = (state.get("thinking") or "") + str(delta)
-        elif chunk_type == "tool-input-available":
-            state.setdefault("tools", []).append({
-                "tool_name": value.get("toolName"),
-                "tool_call_id": value.get("toolCallId"),
-                "arguments": value.get("input"),
-                "status": "selected",
-            })
-        elif chunk_type == "tool-output-available":
-            state.setdefault("tools", []).append({
-                "tool_call_id": value.get("toolCallId"),
-                "result": value.get("output"),
-                "status": "result",
-            })
-        elif chunk_type == "tool-output-error":
-            state.setdefault("errors", []).append({
-                "tool_call_id": value.get("toolCallId"),
-                "error": value.get("errorText"),
-            })
-        elif chunk_type == "error":
-            state.setdefault("errors", []).append({
-                "error": value.get("errorText"),
-            })
-        
+        _accumulate_vercel_chunk(state, value)
         return state
 
     # --- OpenAI mode (raw LiteLLM chunks with choices[].delta) ---
@@ -239,9 +328,9 @@ def _weave_stream_accumulator(state: Any | None, value: Any) -> dict:
                 if content:
                     # Reset on first content after step finished (new step starting)
                     if state.get("_step_finished"):
-                        _reset_step_content()
+                        _reset_step_content(state)
                         state["_step_finished"] = False
-                    state["content"] = (state.get("content") or "") + str(content)
+                    state["content"] += str(content)
                 
                 # Extract thinking/reasoning tokens (different providers use different attributes)
                 reasoning = (
@@ -252,9 +341,9 @@ def _weave_stream_accumulator(state: Any | None, value: Any) -> dict:
                 if reasoning:
                     # Reset on first reasoning after step finished (new step starting)
                     if state.get("_step_finished"):
-                        _reset_step_content()
+                        _reset_step_content(state)
                         state["_step_finished"] = False
-                    state["thinking"] = (state.get("thinking") or "") + str(reasoning)
+                    state["thinking"] += str(reasoning)
     except Exception:
         # Chunk shapes vary by provider; keep tracing robust.
         pass
@@ -262,6 +351,28 @@ def _weave_stream_accumulator(state: Any | None, value: Any) -> dict:
     return state
 
 
+@functools.lru_cache(maxsize=128)
+def _build_output_tool(response_type: Type[BaseModel]) -> Dict[str, Any]:
+    """Build the output tool definition for a response model, once per class.
+
+    Schema generation walks the whole model tree; callers must copy the result
+    before handing it out.
+    """
+    schema_name = response_type.__name__
+    return {
+        "type": "function",
+        "function": {
+            "name": f"__{schema_name}_output__",
+            "description": (
+                f"Submit your final {schema_name} response. "
+                f"Call this tool ONLY when you have gathered all necessary information "
+                f"and are ready to provide your structured answer. "
+                f"The arguments must match the {schema_name} schema exactly."
+            ),
+            "parameters": response_type.model_json_schema()
+        }
+    }
+
 
 class AgentPrompt(Prompt):
     system_template: str = Field(default="""<agent_overview>
@@ -341,10 +452,10 @@ This ensures the user can access the file correctly.
 </file_handling_instructions>""")
 
     def system_prompt(self, purpose: Union[str, Prompt], name: str, model_name: str, tools: List[Dict], notes: Union[str, Prompt] = "", skills_description: str = "", agents_md_content: str = "") -> str:
-        # Use cached tools description if available and tools haven't changed
-        cache_key = f"{len(tools)}_{id(tools)}"
-        if not hasattr(self, '_tools_cache') or self._tools_cache.get('key') != cache_key:
-            # Format tools description
+        # Format tools description. This is a single pass over the tool list, so it is
+        # rebuilt on every call rather than cached under a key that can go stale.
+        tools_description_str = "No tools available."
+        if tools:
             tools_description_lines = []
             for tool in tools:
                 if tool.get('type') == 'function' and 'function' in tool:
@@ -352,11 +463,8 @@ This ensures the user can access the file correctly.
                     tool_name = tool_func.get('name', 'N/A')
                     description = tool_func.get('description', 'No description available.')
                     tools_description_lines.append(f"- `{tool_name}`: {description}")
-
-            tools_description_str = "\n".join(tools_description_lines) if tools_description_lines else "No tools available."
-            self._tools_cache = {'key': cache_key, 'description': tools_description_str}
-        else:
-            tools_description_str = self._tools_cache['description']
+            if tools_description_lines:
+                tools_description_str = "\n".join(tools_description_lines)
 
         # Handle both string and Prompt types
         if isinstance(purpose, Prompt):
@@ -431,7 +539,11 @@ class Agent(BaseModel):
     agents_md: Optional[Union[bool, str, List[str]]] = Field(default=True, description="AGENTS.md project instructions. Default/True=auto-discover from base dir or CWD upward, None/False=disabled, str=explicit path, List[str]=multiple paths.")
     agents_md_base_dir: Optional[str] = Field(default=None, description="Base directory for AGENTS.md auto-discovery. Defaults to current working directory.")
     instruction_role: Literal["system", "developer"] = Field(default="system", description="Role used for the generated instruction prompt in LiteLLM chat completion messages.")
+    background_thread_saves: bool = Field(default=False, description="Persist intermediate thread state from the run() and stream() tool loops in the background so the next completion starts without waiting on the thread store. The final save is always awaited before the run or stream finishes.")
+    cache_system_prompt: bool = Field(default=False, description="Mark the instruction prompt with an Anthropic cache_control breakpoint so the provider can reuse the cached prefix across steps. Ignored for non-Anthropic models.")
     max_tool_iterations: int = Field(default=10)
+    stream_chunk_batch_size: int = Field(default=1, ge=1, description="Number of consecutive content (or thinking) deltas coalesced into one LLM_STREAM_CHUNK / LLM_THINKING_CHUNK event when streaming. 1 emits an event per provider delta; buffered text is always flushed before tool calls, errors and the final response.")
+    max_parallel_tools: Optional[int] = Field(default=None, ge=1, description="Maximum number of tool calls from a single completion that run concurrently. None runs them all at once.")
     agents: List["Agent"] = Field(default_factory=list, description="List of agents that this agent can delegate tasks to.")
     thread_store: Optional[ThreadStore] = Field(default=None, description="Thread store instance for managing conversation threads", exclude=True)
     file_store: Optional[FileStore] = Field(default=None, description="File store instance for managing file attachments", exclude=True)
@@ -473,7 +585,11 @@ class Agent(BaseModel):
     _skills_description: str = PrivateAttr(default="")
     _skill_tool_defs: List[Dict] = PrivateAttr(default_factory=list)
     _agents_md_content: str = PrivateAttr(default="")
+    _completion_cache: CompletionCache = PrivateAttr(default_factory=CompletionCache)
+    _tool_result_cache: ToolResultCache = PrivateAttr(default_factory=ToolResultCache)
+    _thread_inflight: Dict[str, Tuple["asyncio.Future[Optional[Thread]]", List[asyncio.Future]]] = PrivateAttr(default_factory=dict)
     step_errors_raise: bool = Field(default=False, description="If True, step() will raise exceptions instead of returning an error message tuple for backward compatibility.")
+    cache_mode: Literal["off", "exact"] = Field(default="off", description="Completion response caching. 'off' always calls the model; 'exact' reuses the response for a byte-identical non-streaming request (same model, temperature, tools and messages).")
 
     model_config = {
         "arbitrary_types_allowed": True,
@@ -554,11 +670,11 @@ class Agent(BaseModel):
 
         # Create default stores if not provided
         if self.thread_store is None:
-            logging.getLogger(__name__).info(f"Creating default in-memory thread store for agent {self.name}")
+            logger.info(f"Creating default in-memory thread store for agent {self.name}")
             self.thread_store = ThreadStore()  # Uses in-memory backend by default
 
         if self.file_store is None:
-            logging.getLogger(__name__).info(f"Creating default file store for agent {self.name}")
+            logger.info(f"Creating default file store for agent {self.name}")
             self.file_store = FileStore()  # Uses default settings
 
         # Now generate the system prompt including the tools
@@ -624,10 +740,20 @@ class Agent(BaseModel):
 
         self._mcp_tool_names.clear()
 
-    def _build_instruction_message(self, content: str) -> Dict[str, str]:
+    def _build_instruction_message(self, content: str) -> Dict[str, Any]:
         """Build the instruction message prepended to model completion calls."""
+        if self.cache_system_prompt and self._supports_cache_control():
+            return {
+                "role": self.instruction_role,
+                "content": [{"type": "text", "text": content, "cache_control": {"type": "ephemeral"}}],
+            }
         return {"role": self.instruction_role, "content": content}
 
+    def _supports_cache_control(self) -> bool:
+        """Whether the configured model accepts explicit prompt cache breakpoints."""
+        model = self.model_name.lower()
+        return "claude" in model or "anthropic" in model
+
     def model_post_init(self, __context: Any) -> None:
         """Pydantic v2 hook called after model initialization.
         
@@ -703,13 +829,13 @@ class Agent(BaseModel):
         from tyler.config import load_config, _resolve_config_path
         
         # Load config from file
-        logging.getLogger(__name__).info(f"Creating agent from config: {config_path or 'auto-discovered'}")
+        logger.info(f"Creating agent from config: {config_path or 'auto-discovered'}")
         resolved_config_path = _resolve_config_path(config_path)
         config = load_config(str(resolved_config_path))
         
         # Apply overrides (replacement semantics - dict.update replaces)
         if overrides:
-            logging.getLogger(__name__).debug(f"Config overrides: {list(overrides.keys())}")
+            logger.debug(f"Config overrides: {list(overrides.keys())}")
             config.update(overrides)
 
         if config.get("agents_md", True) is True and "agents_md_base_dir" not in config:
@@ -846,18 +972,30 @@ class Agent(BaseModel):
                 rich_context = None
         
         trace_tool_name = getattr(normalized_tool_call.function, 'name', None)
-        trace_tool_call_id = getattr(normalized_tool_call, 'id', None)
-        trace_arguments_raw = getattr(normalized_tool_call.function, 'arguments', '{}')
-        try:
-            trace_arguments = json.loads(trace_arguments_raw) if isinstance(trace_arguments_raw, str) else trace_arguments_raw
-        except (json.JSONDecodeError, TypeError):
-            trace_arguments = trace_arguments_raw
 
-        trace_span = self._trace_tool_start(
-            tool_name=trace_tool_name or "",
-            arguments=trace_arguments,
-            tool_call_id=str(trace_tool_call_id) if trace_tool_call_id is not None else None,
-        )
+        # Tools opt in to result reuse with the "cacheable" attribute
+        result_cache_key = self._tool_result_cache_key(trace_tool_name, normalized_tool_call)
+        if result_cache_key is not None:
+            hit, cached_result = self._tool_result_cache.get(result_cache_key)
+            if hit:
+                return cached_result
+
+        # Only decode arguments for the trace span when a tracer is active; the
+        # tool runner parses them again for execution.
+        trace_span = None
+        if self._weave_agents_tracer is not None:
+            trace_tool_call_id = getattr(normalized_tool_call, 'id', None)
+            trace_arguments_raw = getattr(normalized_tool_call.function, 'arguments', '{}')
+            try:
+                trace_arguments = loads_tool_arguments(trace_arguments_raw) if isinstance(trace_arguments_raw, str) else trace_arguments_raw
+            except (json.JSONDecodeError, TypeError):
+                trace_arguments = trace_arguments_raw
+
+            trace_span = self._trace_tool_start(
+                tool_name=trace_tool_name or "",
+                arguments=trace_arguments,
+                tool_call_id=str(trace_tool_call_id) if trace_tool_call_id is not None else None,
+            )
 
         execution_runner = self._tool_runner
         if self._legacy_tool_runner_method_is_patched("execute_tool_call") or (
@@ -874,18 +1012,132 @@ class Agent(BaseModel):
             raise
 
         self._trace_tool_finish(trace_span, result=result)
+        if result_cache_key is not None:
+            ttl = self._get_tool_attributes(trace_tool_name).get("cache_ttl_seconds")
+            self._tool_result_cache.put(result_cache_key, result, ttl_seconds=ttl)
         return result
+
+    def _tool_result_cache_key(self, tool_name: Optional[str], tool_call: Any) -> Optional[str]:
+        """Return the result-cache key for a call to a cacheable tool, or None.
+
+        Tools are only cached when registered with ``attributes={"cacheable": True}``;
+        the key covers the tool name and its decoded arguments, so argument order
+        and whitespace don't matter. Tools that take a context (``ctx``, ``context``
+        or ``_agent_ctx``) are never cached, since their result may depend on the
+        caller's deps (user, session, ...) rather than on the arguments alone.
+        """
+        if not tool_name:
+            return None
+        attributes = self._get_tool_attributes(tool_name)
+        if not attributes or not attributes.get("cacheable"):
+            return None
+        # Unregistered tools (None) are not cached either
+        if self._tool_runner.tool_uses_context(tool_name) is not False:
+            return None
+        arguments = getattr(tool_call.function, 'arguments', '{}')
+        try:
+            if isinstance(arguments, (str, bytes)):
+                arguments = loads_tool_arguments(arguments)
+        except (json.JSONDecodeError, TypeError):
+            return None
+        return ToolResultCache.make_key(tool_name, arguments)
     
+    async def _execute_tool_calls(self, tool_calls: List[Any]) -> Tuple[Dict[str, Any], Dict[str, float]]:
+        """Execute tool calls concurrently, bounded by `max_parallel_tools`.
+
+        Tool exceptions are captured as the result value instead of being raised.
+
+        Returns:
+            Tuple of (results by tool call id, durations in ms by tool call id).
+            Calls without an id cannot be matched to a result and are skipped.
+        """
+        keyed_calls = [
+            (tc, tc_id)
+            for tc, tc_id in zip(tool_calls, map(self._tool_call_id, tool_calls))
+            if tc_id
+        ]
+        results, durations_ms = await self._run_tool_calls([tc for tc, _tc_id in keyed_calls])
+        tc_ids = [tc_id for _tc, tc_id in keyed_calls]
+        return dict(zip(tc_ids, results)), dict(zip(tc_ids, durations_ms))
+
+    async def _run_tool_calls(self, tool_calls: List[Any]) -> Tuple[List[Any], List[float]]:
+        """Execute tool calls concurrently, bounded by `max_parallel_tools`.
+
+        Results are recorded as each tool finishes rather than after the slowest one.
+        Tool exceptions are captured as the result value instead of being raised.
+
+        Returns:
+            Tuple of (results, durations in ms), both in the order of `tool_calls`.
+        """
+        results: List[Any] = [None] * len(tool_calls)
+        durations_ms: List[float] = [0.0] * len(tool_calls)
+        semaphore = self._new_tool_semaphore()
+
+        async def _run_one_tool(index: int, tc: Any) -> None:
+            async with semaphore if semaphore is not None else contextlib.nullcontext():
+                start = time.perf_counter_ns()
+                try:
+                    # _handle_tool_execution reads `self._tool_context` internally.
+                    res = await self._handle_tool_execution(tc)
+                except Exception as tool_exc:
+                    res = tool_exc
+                durations_ms[index] = (time.perf_counter_ns() - start) / 1e6
+            results[index] = res
+
+        tasks = [asyncio.create_task(_run_one_tool(i, tc)) for i, tc in enumerate(tool_calls)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                await next_done
+        finally:
+            # If the caller is cancelled, don't leave tool executions running orphaned
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+        return results, durations_ms
+
+    @staticmethod
+    def _unpack_tool_call(tool_call: Any) -> Tuple[Optional[str], str, Any]:
+        """Return `(id, name, raw arguments)` for an object- or dict-shaped tool call."""
+        if isinstance(tool_call, dict):
+            function = tool_call['function']
+            return tool_call.get('id'), function['name'], function['arguments']
+        function = tool_call.function
+        return getattr(tool_call, 'id', None), function.name, function.arguments
+
+    @staticmethod
+    def _tool_call_id(tool_call: Any) -> Optional[str]:
+        """Return the id of an object- or dict-shaped tool call, or None if it has none."""
+        if isinstance(tool_call, dict):
+            return tool_call.get("id")
+        return getattr(tool_call, "id", None)
+
+    def _new_tool_semaphore(self) -> Optional[asyncio.Semaphore]:
+        """Create the per-step semaphore that caps concurrent tool calls, if configured."""
+        if self.max_parallel_tools is None:
+            return None
+        return asyncio.Semaphore(self.max_parallel_tools)
+
     async def _get_completion(self, **completion_params) -> Any:
         """Get a completion from the LLM with weave tracing.
         
         This is a thin wrapper around acompletion for backward compatibility
-        with tests that mock this method.
+        with tests that mock this method. When `cache_mode="exact"`, identical
+        non-streaming requests are served from an in-memory LRU cache; cached
+        responses are copies that report zero token usage.
         
         Returns:
             Any: The completion response.
         """
-        response = await acompletion(**completion_params)
+        if self.cache_mode == "off" or completion_params.get("stream"):
+            return await acompletion(**completion_params)
+
+        cache_key = CompletionCache.make_key(completion_params)
+        if cache_key is None:
+            return await acompletion(**completion_params)
+        response = self._completion_cache.get(cache_key)
+        if response is None:
+            response = await acompletion(**completion_params)
+            self._completion_cache.put(cache_key, response)
         return response
     
     @weave.op()
@@ -977,31 +1229,7 @@ class Agent(BaseModel):
                 tool_results_by_id: Dict[str, Any] = {}
                 tool_durations_ms_by_id: Dict[str, float] = {}
                 if tool_calls:
-                    # Execute all tools concurrently (restore pre-refactor behavior).
-                    async def _run_one_tool(tc: Any) -> Tuple[Optional[str], Any, float]:
-                        try:
-                            tc_id_local = tc.id if hasattr(tc, "id") else tc.get("id")
-                        except Exception:
-                            tc_id_local = None
-                        if not tc_id_local:
-                            return None, None, 0.0
-
-                        start = datetime.now(timezone.utc)
-                        try:
-                            # _handle_tool_execution reads `self._tool_context` internally.
-                            res = await self._handle_tool_execution(tc)
-                        except Exception as tool_exc:
-                            res = tool_exc
-                        duration_ms = (datetime.now(timezone.utc) - start).total_seconds() * 1000
-                        return str(tc_id_local), res, duration_ms
-
-                    tasks = [_run_one_tool(tc) for tc in tool_calls]
-                    results = await asyncio.gather(*tasks, return_exceptions=False)
-                    for tc_id, res, dur in results:
-                        if not tc_id:
-                            continue
-                        tool_results_by_id[tc_id] = res
-                        tool_durations_ms_by_id[tc_id] = dur
+                    tool_results_by_id, tool_durations_ms_by_id = await self._execute_tool_calls(tool_calls)
 
                 if tool_results_by_id:
                     metrics["_tool_execution_results"] = tool_results_by_id
@@ -1013,18 +1241,12 @@ class Agent(BaseModel):
                 raise
             # Backward-compatible behavior: append error message and return (thread, [error_message])
             error_text = f"I encountered an error: {str(e)}"
+            source = self._create_assistant_source()
+            source["attributes"]["purpose"] = str(self.purpose)
             error_msg = Message(
                 role='assistant', 
                 content=error_text,
-                source={
-                    "id": self.name,
-                    "name": self.name,
-                    "type": "agent",
-                    "attributes": {
-                        "model": self.model_name,
-                        "purpose": str(self.purpose)
-                    }
-                }
+                source=source
             )
             error_msg.metrics = {"error": str(e)}
             thread.add_message(error_msg)
@@ -1035,12 +1257,47 @@ class Agent(BaseModel):
         if isinstance(thread_or_id, str):
             if not self.thread_store:
                 raise ValueError("Thread store is required when passing thread ID")
-            thread = await self.thread_store.get(thread_or_id)
+            thread = await self._fetch_thread_coalesced(thread_or_id)
             if not thread:
                 raise ValueError(f"Thread with ID {thread_or_id} not found")
             return thread
         return thread_or_id
 
+    async def _fetch_thread_coalesced(self, thread_id: str) -> Optional[Thread]:
+        """Fetch a thread from the store, sharing one lookup between concurrent callers.
+
+        The caller that starts the lookup gets the store's Thread as-is. Callers that
+        join a lookup already in flight each get a deep copy, made as soon as the
+        lookup finishes, so concurrent runs never append to a shared message list.
+        """
+        inflight = self._thread_inflight.get(thread_id)
+        if inflight is not None:
+            joined = asyncio.get_running_loop().create_future()
+            inflight[1].append(joined)
+            return await joined
+
+        lookup = asyncio.ensure_future(self.thread_store.get(thread_id))
+        joiners: List[asyncio.Future] = []
+        self._thread_inflight[thread_id] = (lookup, joiners)
+
+        def _resolve_joiners(done: "asyncio.Future[Optional[Thread]]") -> None:
+            # Runs before any waiter resumes, so the copies can't see later changes
+            self._thread_inflight.pop(thread_id, None)
+            for joined in joiners:
+                if joined.done():
+                    continue
+                if done.cancelled():
+                    joined.cancel()
+                elif done.exception() is not None:
+                    joined.set_exception(done.exception())
+                else:
+                    thread = done.result()
+                    joined.set_result(thread.model_copy(deep=True) if thread is not None else None)
+
+        lookup.add_done_callback(_resolve_joiners)
+        # Shield so a cancelled starter doesn't cancel the lookup for the joiners
+        return await asyncio.shield(lookup)
+
     def _latest_user_message_content(self, thread: Thread) -> Optional[Any]:
         """Return the most recent user message content for turn tracing."""
         for message in reversed(thread.messages):
@@ -1161,7 +1418,7 @@ class Agent(BaseModel):
                 serialized.append(tool_call)
             else:
                 # Ensure ID is present
-                if not hasattr(tool_call, 'id') or not tool_call.id:
+                if not getattr(tool_call, 'id', None):
                     continue
                 serialized.append({
                     "id": str(tool_call.id),
@@ -1241,7 +1498,7 @@ class Agent(BaseModel):
                 tool_context={"db": database, "user_id": current_user.id}
             )
         """
-        logging.getLogger(__name__).debug("Agent.run() called (non-streaming mode)")
+        logger.debug("Agent.run() called (non-streaming mode)")
         
         # Use provided response_type, or fall back to agent's default
         effective_response_type = response_type if response_type is not None else self.response_type
@@ -1298,22 +1555,7 @@ class Agent(BaseModel):
         Returns:
             Tool definition dict in OpenAI format
         """
-        schema = response_type.model_json_schema()
-        schema_name = response_type.__name__
-        
-        return {
-            "type": "function",
-            "function": {
-                "name": f"__{schema_name}_output__",
-                "description": (
-                    f"Submit your final {schema_name} response. "
-                    f"Call this tool ONLY when you have gathered all necessary information "
-                    f"and are ready to provide your structured answer. "
-                    f"The arguments must match the {schema_name} schema exactly."
-                ),
-                "parameters": schema
-            }
-        }
+        return copy.deepcopy(_build_output_tool(response_type))
     
     async def _run_with_structured_output(
         self,
@@ -1375,15 +1617,19 @@ class Agent(BaseModel):
         retry_history = []
         new_messages = []
         events: List[ExecutionEvent] = []
-        start_time = datetime.now(timezone.utc)
+        start_ns = time.perf_counter_ns()
+        total_tokens = 0
 
         def record_event(event_type: EventType, data: Dict[str, Any], attributes=None):
+            nonlocal total_tokens
             events.append(ExecutionEvent(
                 type=event_type,
                 timestamp=datetime.now(timezone.utc),
                 data=data,
                 attributes=attributes,
             ))
+            if event_type == EventType.LLM_RESPONSE:
+                total_tokens += data.get("tokens", {}).get("total_tokens", 0)
         
         try:
             # Reset iteration count
@@ -1421,10 +1667,11 @@ class Agent(BaseModel):
                 content = assistant_message.content or ""
                 tool_calls = getattr(assistant_message, 'tool_calls', None)
                 has_tool_calls = tool_calls is not None and len(tool_calls) > 0
+                serialized_tool_calls = self._serialize_tool_calls(tool_calls) if has_tool_calls else None
 
                 record_event(EventType.LLM_RESPONSE, {
                     "content": content,
-                    "tool_calls": self._serialize_tool_calls(tool_calls) if has_tool_calls else None,
+                    "tool_calls": serialized_tool_calls,
                     "tokens": metrics.get("usage", {}),
                     "latency_ms": metrics.get("timing", {}).get("latency", 0),
                 })
@@ -1434,7 +1681,7 @@ class Agent(BaseModel):
                     message = Message(
                         role="assistant",
                         content=content,
-                        tool_calls=self._serialize_tool_calls(tool_calls) if has_tool_calls else None,
+                        tool_calls=serialized_tool_calls,
                         source=self._create_assistant_source(include_version=True),
                         metrics=metrics
                     )
@@ -1446,14 +1693,12 @@ class Agent(BaseModel):
                     # Separate output tool call from regular tool calls
                     # Store (tool_call, tool_name) tuples to avoid re-extracting names
                     output_tool_call = None
-                    regular_tool_calls = []  # List of (tool_call, tool_name) tuples
+                    regular_tool_calls = []  # List of (tool_call, tool_name, tool_id) tuples
                     
                     for tool_call in tool_calls:
-                        tool_name = tool_call.function.name if hasattr(tool_call, 'function') else tool_call['function']['name']
-                        tool_id = tool_call.id if hasattr(tool_call, 'id') else tool_call.get('id')
-                        args = tool_call.function.arguments if hasattr(tool_call, 'function') else tool_call['function']['arguments']
+                        tool_id, tool_name, args = self._unpack_tool_call(tool_call)
                         try:
-                            parsed_args = json.loads(args) if isinstance(args, str) else args
+                            parsed_args = loads_tool_arguments(args) if isinstance(args, str) else args
                         except (json.JSONDecodeError, TypeError, AttributeError):
                             parsed_args = {}
                         record_event(EventType.TOOL_SELECTED, {
@@ -1464,15 +1709,20 @@ class Agent(BaseModel):
                         if tool_name == output_tool_name:
                             output_tool_call = tool_call
                         else:
-                            regular_tool_calls.append((tool_call, tool_name))
+                            regular_tool_calls.append((tool_call, tool_name, tool_id))
                     
-                    # Process regular tool calls first
+                    # Process regular tool calls first. They run concurrently; results
+                    # are added to the thread in the order the model requested them.
                     should_break = False
-                    for tool_call, tool_name in regular_tool_calls:
-                        tool_start = datetime.now(timezone.utc)
-                        result = await self._handle_tool_execution(tool_call)
-                        duration_ms = (datetime.now(timezone.utc) - tool_start).total_seconds() * 1000
-                        tool_id = tool_call.id if hasattr(tool_call, 'id') else tool_call.get('id')
+                    # Calls are matched to results by position, so calls without an id run too.
+                    tool_results, tool_durations_ms = [], []
+                    if regular_tool_calls:
+                        tool_results, tool_durations_ms = await self._run_tool_calls(
+                            [tool_call for tool_call, _name, _id in regular_tool_calls]
+                        )
+                    for (tool_call, tool_name, tool_id), result, duration_ms in zip(
+                        regular_tool_calls, tool_results, tool_durations_ms
+                    ):
                         tool_message, break_iteration = self._process_tool_result(result, tool_call, tool_name)
                         if isinstance(result, Exception):
                             record_event(EventType.TOOL_ERROR, {
@@ -1543,13 +1793,8 @@ class Agent(BaseModel):
                             if self.thread_store:
                                 await self.thread_store.save(thread)
 
-                            total_tokens = sum(
-                                event.data.get("tokens", {}).get("total_tokens", 0)
-                                for event in events
-                                if event.type == EventType.LLM_RESPONSE
-                            )
                             record_event(EventType.EXECUTION_COMPLETE, {
-                                "duration_ms": (datetime.now(timezone.utc) - start_time).total_seconds() * 1000,
+                                "duration_ms": (time.perf_counter_ns() - start_ns) / 1e6,
                                 "total_tokens": total_tokens,
                             })
                             
@@ -1616,7 +1861,7 @@ class Agent(BaseModel):
                                 "response_preview": response_str[:500]
                             })
                             
-                            logging.getLogger(__name__).warning(
+                            logger.warning(
                                 f"Structured output validation failed (attempt {retry_count}/{max_retries + 1}): {e}"
                             )
                             
@@ -1701,7 +1946,7 @@ class Agent(BaseModel):
                 last_response=last_response
             )
     
-    @weave.op(accumulator=_weave_stream_accumulator)
+    @weave.op(accumulator=_weave_stream_accumulator, postprocess_output=_weave_stream_summary)
     async def stream(
         self,
         thread_or_id: Union[Thread, str],
@@ -1790,19 +2035,22 @@ class Agent(BaseModel):
             from tyler.streaming import get_stream_mode
             stream_mode = get_stream_mode(mode)
             
-            logging.getLogger(__name__).debug(f"Agent.stream() called with mode='{mode}'")
-            async for item in stream_mode.stream(self, thread):
-                yield item
+            logger.debug(f"Agent.stream() called with mode='{mode}'")
+            # Close the mode's stream as soon as ours is closed so its cleanup runs now
+            async with contextlib.aclosing(stream_mode.stream(self, thread)) as items:
+                async for item in items:
+                    yield item
         finally:
             self._finish_weave_agents_trace()
             # Clear tool context after execution
             self._tool_context = None
     
-    @weave.op(accumulator=_weave_stream_accumulator)
+    @weave.op(accumulator=_weave_stream_accumulator, postprocess_output=_weave_stream_summary)
     async def step_stream(
         self,
         thread: Thread,
         mode: Literal["events", "openai", "vercel", "vercel_objects"] = "events",
+        saver: Optional["StreamThreadSaver"] = None,
     ) -> AsyncGenerator[Union[ExecutionEvent, Any, str], None]:
         """Execute a single streaming step (one LLM streamed completion + resulting tool execution).
 
@@ -1811,6 +2059,12 @@ class Agent(BaseModel):
         
         Note: For most use cases, use `stream()` which handles multi-step iteration.
         This method is for advanced use cases where you need step-by-step control.
+        
+        Args:
+            thread: The thread to run the step on
+            mode: Streaming output format
+            saver: Thread saver shared by the steps of one stream. When omitted,
+                   every save is awaited before the step finishes.
         """
         # Reset per-step flags
         self._last_step_stream_had_tool_calls = False
@@ -1818,19 +2072,19 @@ class Agent(BaseModel):
 
         if mode == "events":
             from tyler.streaming.events import events_stream_mode
-            async for event in events_stream_mode._step_stream(self, thread):
+            async for event in events_stream_mode._step_stream(self, thread, saver):
                 yield event
         elif mode == "openai":
             from tyler.streaming.openai import openai_stream_mode
-            async for chunk in openai_stream_mode._step_stream(self, thread):
+            async for chunk in openai_stream_mode._step_stream(self, thread, saver):
                 yield chunk
         elif mode == "vercel":
             from tyler.streaming.vercel import vercel_stream_mode
-            async for sse in vercel_stream_mode._step_stream(self, thread):
+            async for sse in vercel_stream_mode._step_stream(self, thread, saver):
                 yield sse
         elif mode == "vercel_objects":
             from tyler.streaming.vercel_objects import vercel_objects_stream_mode
-            async for chunk in vercel_objects_stream_mode._step_stream(self, thread):
+            async for chunk in vercel_objects_stream_mode._step_stream(self, thread, saver):
                 yield chunk
         else:
             raise ValueError(
@@ -1898,17 +2152,28 @@ class Agent(BaseModel):
         """Non-streaming implementation that collects all events and returns AgentResult."""
         # Initialize execution tracking
         events = []
-        start_time = datetime.now(timezone.utc)
+        start_ns = time.perf_counter_ns()
         new_messages = []
+        pending_save: Optional[asyncio.Task] = None
+        # Running totals maintained by record_event so completion needs no rescans
+        total_tokens = 0
+        output = None
         
         # Helper to record events
         def record_event(event_type: EventType, data: Dict[str, Any], attributes=None):
+            nonlocal total_tokens, output
             events.append(ExecutionEvent(
                 type=event_type,
                 timestamp=datetime.now(timezone.utc),
                 data=data,
                 attributes=attributes
             ))
+            if event_type == EventType.LLM_RESPONSE:
+                total_tokens += data.get("tokens", {}).get("total_tokens", 0)
+            elif event_type == EventType.MESSAGE_CREATED:
+                message = data["message"]
+                if message.role == "assistant" and message.content:
+                    output = message.content
             
         # Reset iteration count at the beginning of each go call
         self._iteration_count = 0
@@ -1944,7 +2209,7 @@ class Agent(BaseModel):
                     await self.thread_store.save(thread)
                 # Nothing else to do; avoid duplicate saves and return immediately.
                 record_event(EventType.EXECUTION_COMPLETE, {
-                    "duration_ms": (datetime.now(timezone.utc) - start_time).total_seconds() * 1000,
+                    "duration_ms": (time.perf_counter_ns() - start_ns) / 1e6,
                     "total_tokens": 0,
                 })
                 return AgentResult(
@@ -1988,13 +2253,11 @@ class Agent(BaseModel):
                                 "error_type": "StepError",
                                 "message": metrics[-1].content if isinstance(metrics, list) and metrics else "Step error"
                             })
-                            if self.thread_store:
-                                await self.thread_store.save(thread)
                             break
                         
                         if not response or not hasattr(response, 'choices') or not response.choices:
                             error_msg = "No response received from chat completion"
-                            logging.getLogger(__name__).error(error_msg)
+                            logger.error(error_msg)
                             record_event(EventType.EXECUTION_ERROR, {
                                 "error_type": "NoResponse",
                                 "message": error_msg
@@ -2003,8 +2266,6 @@ class Agent(BaseModel):
                             thread.add_message(message)
                             new_messages.append(message)
                             record_event(EventType.MESSAGE_CREATED, {"message": message})
-                            if self.thread_store:
-                                await self.thread_store.save(thread)
                             break
                         
                         # Process response
@@ -2012,11 +2273,12 @@ class Agent(BaseModel):
                         content = assistant_message.content or ""
                         tool_calls = getattr(assistant_message, 'tool_calls', None)
                         has_tool_calls = tool_calls is not None and len(tool_calls) > 0
+                        serialized_tool_calls = self._serialize_tool_calls(tool_calls) if has_tool_calls else None
 
                         # Record LLM response
                         record_event(EventType.LLM_RESPONSE, {
                             "content": content,
-                            "tool_calls": self._serialize_tool_calls(tool_calls) if has_tool_calls else None,
+                            "tool_calls": serialized_tool_calls,
                             "tokens": metrics.get("usage", {}),
                             "latency_ms": metrics.get("timing", {}).get("latency", 0)
                         })
@@ -2026,7 +2288,7 @@ class Agent(BaseModel):
                             message = Message(
                                 role="assistant",
                                 content=content,
-                                tool_calls=self._serialize_tool_calls(tool_calls) if has_tool_calls else None,
+                                tool_calls=serialized_tool_calls,
                                 source=self._create_assistant_source(include_version=True),
                                 metrics=metrics
                             )
@@ -2044,33 +2306,18 @@ class Agent(BaseModel):
                             # it was patched in a test), execute them here so behavior matches the
                             # pre-refactor run loop.
                             if not tool_execution_results:
-                                tool_execution_results = {}
-                                tool_execution_durations_ms = {}
-                                for tc in tool_calls:
-                                    try:
-                                        tc_id = tc.id if hasattr(tc, "id") else tc.get("id")
-                                    except Exception:
-                                        tc_id = None
-                                    if not tc_id:
-                                        continue
-                                    try:
-                                        # _handle_tool_execution reads `self._tool_context` internally.
-                                        start = datetime.now(timezone.utc)
-                                        tool_execution_results[str(tc_id)] = await self._handle_tool_execution(tc)
-                                        tool_execution_durations_ms[str(tc_id)] = (datetime.now(timezone.utc) - start).total_seconds() * 1000
-                                    except Exception as tool_exc:
-                                        tool_execution_results[str(tc_id)] = tool_exc
-                                        tool_execution_durations_ms[str(tc_id)] = (datetime.now(timezone.utc) - start).total_seconds() * 1000
+                                tool_execution_results, tool_execution_durations_ms = await self._execute_tool_calls(tool_calls)
+
+                            # Decode each tool call once for both the selection and result passes
+                            unpacked_tool_calls = [
+                                (tool_call, *self._unpack_tool_call(tool_call)) for tool_call in tool_calls
+                            ]
 
                             # Record tool selections
-                            for tool_call in tool_calls:
-                                tool_name = tool_call.function.name if hasattr(tool_call, 'function') else tool_call['function']['name']
-                                tool_id = tool_call.id if hasattr(tool_call, 'id') else tool_call.get('id')
-                                args = tool_call.function.arguments if hasattr(tool_call, 'function') else tool_call['function']['arguments']
-                                
+                            for _tool_call, tool_id, tool_name, args in unpacked_tool_calls:
                                 # Parse arguments
                                 try:
-                                    parsed_args = json.loads(args) if isinstance(args, str) else args
+                                    parsed_args = loads_tool_arguments(args) if isinstance(args, str) else args
                                 except (json.JSONDecodeError, TypeError, AttributeError):
                                     parsed_args = {}
                                 
@@ -2081,20 +2328,17 @@ class Agent(BaseModel):
                                 })
                             
                             # Process results (tools were executed inside step)
-                            for tool_call in tool_calls:
-                                tool_name = tool_call.function.name if hasattr(tool_call, 'function') else tool_call['function']['name']
-                                tool_id = tool_call.id if hasattr(tool_call, 'id') else tool_call.get('id')
-                                
-                                key = str(tool_id) if tool_id is not None else None
-                                duration_ms = tool_execution_durations_ms.get(key) if key else None
+                            for tool_call, tool_id, tool_name, _args in unpacked_tool_calls:
+                                # Results are keyed by the tool call's own id, so look it up as-is.
+                                duration_ms = tool_execution_durations_ms.get(tool_id)
 
                                 # Distinguish "missing result" from "tool returned None":
                                 # - Missing: tool call id not present in results mapping
                                 # - Present: tool executed; its return value may legitimately be None
-                                if not key or key not in tool_execution_results:
+                                if tool_id is None or tool_id not in tool_execution_results:
                                     result = RuntimeError("Tool result missing")
                                 else:
-                                    result = tool_execution_results.get(key)
+                                    result = tool_execution_results[tool_id]
                                 if isinstance(result, Exception):
                                     record_event(EventType.TOOL_ERROR, {
                                         "tool_name": tool_name,
@@ -2124,22 +2368,26 @@ class Agent(BaseModel):
                                 if break_iteration:
                                     should_break = True
                                 
-                        # Save after processing all tool calls but before next completion
-                        if self.thread_store:
-                            await self.thread_store.save(thread)
-                            
                         if should_break:
                             break
                     
                         # If no tool calls, we are done
                         if not has_tool_calls:
                             break
+
+                        # Save after processing all tool calls but before next completion.
+                        # Exits from the loop are persisted once by the final save below.
+                        if self.thread_store:
+                            if self.background_thread_saves:
+                                pending_save = await self._save_thread_in_background(thread, pending_save)
+                            else:
+                                await self.thread_store.save(thread)
                         
                         self._iteration_count += 1
 
                     except Exception as e:
                         error_msg = f"Error during chat completion: {str(e)}"
-                        logging.getLogger(__name__).error(error_msg)
+                        logger.error(error_msg)
                         record_event(EventType.EXECUTION_ERROR, {
                             "error_type": type(e).__name__,
                             "message": error_msg,
@@ -2149,8 +2397,6 @@ class Agent(BaseModel):
                         thread.add_message(message)
                         new_messages.append(message)
                         record_event(EventType.MESSAGE_CREATED, {"message": message})
-                        if self.thread_store:
-                            await self.thread_store.save(thread)
                         break
                 
                 # Check for max iterations
@@ -2161,30 +2407,19 @@ class Agent(BaseModel):
                     record_event(EventType.MESSAGE_CREATED, {"message": message})
                     record_event(EventType.ITERATION_LIMIT, {"iterations_used": self._iteration_count})
                 
-            # Final save
+            # Final save (after any background save so writes land in order)
+            if pending_save is not None:
+                await pending_save
+                pending_save = None
             if self.thread_store:
                 await self.thread_store.save(thread)
                 
             # Record completion
-            end_time = datetime.now(timezone.utc)
-            total_tokens = sum(
-                event.data.get("tokens", {}).get("total_tokens", 0)
-                for event in events
-                if event.type == EventType.LLM_RESPONSE
-            )
-            
             record_event(EventType.EXECUTION_COMPLETE, {
-                "duration_ms": (end_time - start_time).total_seconds() * 1000,
+                "duration_ms": (time.perf_counter_ns() - start_ns) / 1e6,
                 "total_tokens": total_tokens
             })
             
-            # Extract final output
-            output = None
-            for msg in reversed(new_messages):
-                if msg.role == "assistant" and msg.content:
-                    output = msg.content
-                    break
-            
             return AgentResult(
                 thread=thread,
                 new_messages=new_messages,
@@ -2197,7 +2432,7 @@ class Agent(BaseModel):
             raise
         except Exception as e:
             error_msg = f"Error processing thread: {str(e)}"
-            logging.getLogger(__name__).error(error_msg)
+            logger.error(error_msg)
             message = self._create_error_message(error_msg)
             
             if isinstance(thread_or_id, Thread):
@@ -2218,18 +2453,63 @@ class Agent(BaseModel):
                 "message": error_msg
             })
             
+            if pending_save is not None:
+                await pending_save
+                pending_save = None
             if self.thread_store:
                 await self.thread_store.save(thread)
             
             # Build result even with error
-            end_time = datetime.now(timezone.utc)
-            
             return AgentResult(
                 thread=thread,
                 new_messages=new_messages,
                 content=None,
                 execution=ExecutionDetails.from_events(events),
             )
+        finally:
+            # Reached with a save still pending only on cancellation or a re-raised error
+            if pending_save is not None:
+                pending_save.cancel()
+
+    async def _save_thread_in_background(
+        self, thread: Thread, previous: Optional[asyncio.Task]
+    ) -> Optional[asyncio.Task]:
+        """Start saving a snapshot of the thread without blocking the caller.
+
+        The snapshot copies only the message list, so messages the next step appends
+        aren't written early. The returned task waits for `previous` before saving, so
+        writes still reach the store in order. Threads with attachments that still need
+        storing are saved synchronously instead (returning None), because the store
+        updates those attachments in place and the live thread has to see the result.
+        """
+        if any(
+            attachment.status != "stored"
+            for message in thread.messages
+            for attachment in (message.attachments or ())
+        ):
+            if previous is not None:
+                await previous
+            await self.thread_store.save(thread)
+            return None
+        snapshot = thread.model_copy(update={"messages": list(thread.messages)})
+        return asyncio.create_task(self._save_thread_snapshot(snapshot, previous))
+
+    async def _save_thread_snapshot(self, snapshot: Thread, previous: Optional[asyncio.Task]) -> None:
+        """Save a background snapshot after `previous`, logging failures instead of raising them.
+
+        A failed intermediate save is not fatal: the final save writes the full thread.
+        Cancelling this save also cancels the saves still queued before it.
+        """
+        try:
+            if previous is not None:
+                await previous
+            await self.thread_store.save(snapshot)
+        except asyncio.CancelledError:
+            if previous is not None:
+                previous.cancel()
+            raise
+        except Exception as e:
+            logger.warning(f"Background save of thread {snapshot.id} failed: {e}")
 
     def _create_tool_source(self, tool_name: str) -> Dict:
         """Creates a standardized source entity dict for tool messages."""
@@ -2275,7 +2555,7 @@ class Agent(BaseModel):
                 role="tool",
                 name=tool_name,
                 content=error_msg,
-                tool_call_id=tool_call.id if hasattr(tool_call, 'id') else tool_call.get('id'),
+                tool_call_id=self._tool_call_id(tool_call),
                 source=self._create_tool_source(tool_name),
                 metrics={
                     "timing": {
@@ -2305,7 +2585,7 @@ class Agent(BaseModel):
             role="tool",
             name=tool_name,
             content=content,
-            tool_call_id=tool_call.id if hasattr(tool_call, 'id') else tool_call.get('id'),
+            tool_call_id=self._tool_call_id(tool_call),
             source=self._create_tool_source(tool_name),
             metrics={
                 "timing": {
@@ -2318,9 +2598,9 @@ class Agent(BaseModel):
         
         # Add any files as attachments
         if files:
-            logging.getLogger(__name__).debug(f"Processing {len(files)} files from tool result")
+            logger.debug(f"Processing {len(files)} files from tool result")
             for file_info in files:
-                logging.getLogger(__name__).debug(f"Creating attachment for {file_info.get('filename')} with mime type {file_info.get('mime_type')}")
+                logger.debug(f"Creating attachment for {file_info.get('filename')} with mime type {file_info.get('mime_type')}")
                 attachment = Attachment(
                     filename=file_info["filename"],
                     content=file_info["content"],
@@ -2350,17 +2630,18 @@ class Agent(BaseModel):
             result = await agent.go(thread)
         """
         if not self.mcp:
-            logging.getLogger(__name__).warning("connect_mcp() called but no mcp config provided")
+            logger.warning("connect_mcp() called but no mcp config provided")
             return
         
         if self._mcp_connected:
-            logging.getLogger(__name__).debug("MCP already connected, skipping")
+            logger.debug("MCP already connected, skipping")
             return
 
         # Clear any stale MCP tools left after a previous partial lifecycle before reconnecting.
         self._remove_mcp_tools_from_state()
+        self._tool_result_cache.clear()
         
-        logging.getLogger(__name__).info("Connecting to MCP servers...")
+        logger.info("Connecting to MCP servers...")
         
         from tyler.mcp.config_loader import _load_mcp_config
         
@@ -2395,7 +2676,7 @@ class Agent(BaseModel):
         self._regenerate_system_prompt()
         
         self._mcp_connected = True
-        logging.getLogger(__name__).info(f"MCP connected with {len(mcp_tools)} tools")
+        logger.info(f"MCP connected with {len(mcp_tools)} tools")
     
     async def cleanup(self) -> None:
         """
@@ -2404,6 +2685,7 @@ class Agent(BaseModel):
         Call this when done with the agent to properly close MCP connections.
         Agent can be reused by calling connect_mcp() again if needed.
         """
+        self._tool_result_cache.clear()
         if self._mcp_disconnect:
             try:
                 await self._mcp_disconnect()
@@ -4,16 +4,83 @@ This module handles all LLM completion logic, including parameter building,
 model-specific adjustments, and response processing.
 """
 from typing import Dict, List, Any, Tuple, Optional, Literal
+from collections import OrderedDict
 from datetime import datetime, UTC
 import copy
 import weave
 from litellm import acompletion
 from narrator import Thread
+from tyler.utils.hashing import stable_json_hash
 from tyler.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+class CompletionCache:
+    """Bounded LRU cache of non-streaming completion responses.
+
+    Responses are keyed on a hash of the full completion parameters (model,
+    temperature, messages, tools, ...), so only byte-identical requests hit.
+    Entries are stored and returned as copies, and a returned copy reports zero
+    token usage, since no tokens were spent serving it.
+
+    Attributes:
+        max_entries: Maximum number of responses retained before evicting the
+            least recently used entry
+    """
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+
+    @staticmethod
+    def make_key(completion_params: Dict[str, Any]) -> Optional[str]:
+        """Return a stable hash for a set of completion parameters.
+
+        Returns None when a parameter is not plain JSON data, since such values
+        can't be told apart reliably (two objects may share a ``str()``) and the
+        request must not be cached.
+        """
+        return stable_json_hash(completion_params)
+
+    @staticmethod
+    def _as_cache_hit(response: Any) -> Any:
+        """Return a copy of a cached response that reports no token usage."""
+        response = copy.deepcopy(response)
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            for field in ("completion_tokens", "prompt_tokens", "total_tokens"):
+                if hasattr(usage, field):
+                    setattr(usage, field, 0)
+        # Same flag LiteLLM sets for its own cache hits
+        hidden_params = getattr(response, "_hidden_params", None)
+        if isinstance(hidden_params, dict):
+            hidden_params["cache_hit"] = True
+        return response
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a copy of the cached response for key, or None on a miss."""
+        response = self._entries.get(key)
+        if response is None:
+            return None
+        self._entries.move_to_end(key)
+        return self._as_cache_hit(response)
+
+    def put(self, key: str, response: Any) -> None:
+        """Store a copy of a response, evicting the oldest entry when full."""
+        self._entries[key] = copy.deepcopy(response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class CompletionHandler:
     """Handles LLM completion requests and response processing.
     
@@ -61,6 +128,8 @@ class CompletionHandler:
         self.drop_params = drop_params
         self.reasoning = reasoning
         self.instruction_role = instruction_role
+        # (source tools list, its length, Gemini-compatible copy) from the last call
+        self._gemini_tools_cache: Optional[Tuple[List[Dict], int, List[Dict]]] = None
     
     async def get_completion(
         self,
@@ -146,7 +215,7 @@ class CompletionHandler:
         if len(tools) > 0:
             # Handle Gemini-specific tool modifications
             if "gemini" in self.model_name.lower():
-                params["tools"] = self._modify_tools_for_gemini(tools)
+                params["tools"] = self._get_gemini_tools(tools)
             else:
                 params["tools"] = tools
         
@@ -189,6 +258,19 @@ class CompletionHandler:
         # Fallback: empty dict (no reasoning params)
         return {}
     
+    def _get_gemini_tools(self, tools: List[Dict]) -> List[Dict]:
+        """Return Gemini-compatible tools, reusing the copy from the previous call.
+
+        The agent passes the same tools list on every step of a run, so the
+        deep copy is only redone when a different (or resized) list arrives.
+        """
+        cached = self._gemini_tools_cache
+        if cached is not None and cached[0] is tools and cached[1] == len(tools):
+            return cached[2]
+        modified_tools = self._modify_tools_for_gemini(tools)
+        self._gemini_tools_cache = (tools, len(tools), modified_tools)
+        return modified_tools
+
     def _modify_tools_for_gemini(self, tools: List[Dict]) -> List[Dict]:
         """Modify tools for Gemini compatibility.
         
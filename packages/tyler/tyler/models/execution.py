@@ -36,7 +36,7 @@ class EventType(Enum):
     EXECUTION_COMPLETE = "execution_complete" # {duration_ms, total_tokens}
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionEvent:
     """Atomic unit of execution information"""
     type: EventType
@@ -45,7 +45,7 @@ class ExecutionEvent:
     attributes: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCallSummary:
     """Structured summary of one tool call during agent execution."""
     tool_name: str
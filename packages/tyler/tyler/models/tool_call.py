@@ -9,9 +9,30 @@ from typing import Dict, Any, Optional, Union
 import json
 from tyler.utils.logging import get_logger
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = get_logger(__name__)
 
 
+def loads_tool_arguments(raw: Union[str, bytes]) -> Any:
+    """Decode a JSON tool-arguments payload, using orjson when it is installed.
+
+    orjson is stricter than the stdlib (e.g. it rejects NaN), so inputs it
+    refuses are retried with ``json.loads`` to keep the accepted set unchanged.
+    Raises ``json.JSONDecodeError`` on invalid JSON either way.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
 @dataclass
 class ToolCall:
     """Unified representation of a tool call.
@@ -107,7 +128,7 @@ class ToolCall:
         """
         try:
             if isinstance(args_str, str):
-                return json.loads(args_str)
+                return loads_tool_arguments(args_str)
             elif isinstance(args_str, dict):
                 return args_str
             else:
@@ -0,0 +1,67 @@
+"""Result cache for tools that opt in with the ``cacheable`` attribute."""
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+import copy
+import time
+
+from tyler.utils.hashing import stable_json_hash
+
+
+class ToolResultCache:
+    """Bounded LRU cache of tool results with optional per-entry expiry.
+
+    Results are keyed on the tool name and its decoded arguments. A cached
+    result may legitimately be ``None``, so lookups report hits separately
+    from the value. Results are stored and returned as copies, so a caller
+    changing a returned dict or list doesn't affect later hits.
+
+    Attributes:
+        max_entries: Maximum number of results retained before evicting the
+            least recently used entry
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Any]]" = OrderedDict()
+
+    @staticmethod
+    def make_key(tool_name: str, arguments: Any) -> Optional[str]:
+        """Return a stable hash for a tool call, independent of argument order.
+
+        Returns None when the arguments aren't plain JSON data.
+        """
+        return stable_json_hash({"tool": tool_name, "arguments": arguments})
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Return ``(hit, result)`` for key; expired entries are dropped and miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, result = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, copy.deepcopy(result)
+
+    def put(self, key: str, result: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Store a copy of a result, evicting the oldest entry when full.
+
+        Results that can't be copied are not cached.
+        """
+        try:
+            result = copy.deepcopy(result)
+        except Exception:
+            return
+        expires_at = time.monotonic() + ttl_seconds if ttl_seconds is not None else None
+        self._entries[key] = (expires_at, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -75,15 +75,46 @@ class ChunkAccumulator:
     
     Handles the common pattern of collecting content, tool calls,
     and thinking tokens from streaming chunks.
+    
+    Argument fragments are buffered per tool call and only joined when
+    ``tool_calls`` or ``tool_args`` is read, so reading them always gives the
+    arguments received so far without rebuilding the string on every delta.
+    New fragments are appended to whatever ``tool_args`` holds at that point.
     """
     
     def __init__(self):
         self.content: List[str] = []
         self.thinking: List[str] = []
-        self.tool_calls: List[Dict[str, Any]] = []
         self.current_tool_call: Optional[Dict[str, Any]] = None
-        self.tool_args: Dict[str, str] = {}
+        self._tool_calls: List[Dict[str, Any]] = []
+        self._tool_calls_by_id: Dict[str, Dict[str, Any]] = {}
+        self._tool_args: Dict[str, Any] = {}
+        # Argument fragments per tool call id received since the last join
+        self._tool_arg_parts: Dict[str, List[str]] = {}
         self.metrics: Dict[str, Any] = {}
+
+    @property
+    def tool_calls(self) -> List[Dict[str, Any]]:
+        """Tool calls seen so far, with arguments accumulated up to the latest delta."""
+        self._join_tool_args()
+        return self._tool_calls
+
+    @tool_calls.setter
+    def tool_calls(self, tool_calls: List[Dict[str, Any]]) -> None:
+        self._join_tool_args()
+        self._tool_calls = tool_calls
+        self._tool_calls_by_id = {tc["id"]: tc for tc in tool_calls if tc.get("id")}
+
+    @property
+    def tool_args(self) -> Dict[str, Any]:
+        """Accumulated arguments per tool call id."""
+        self._join_tool_args()
+        return self._tool_args
+
+    @tool_args.setter
+    def tool_args(self, tool_args: Dict[str, Any]) -> None:
+        self._join_tool_args()
+        self._tool_args = tool_args
     
     def add_content(self, chunk: str) -> None:
         """Add a content chunk."""
@@ -105,13 +136,54 @@ class ChunkAccumulator:
     
     def has_tool_calls(self) -> bool:
         """Check if there are any tool calls."""
-        return bool(self.tool_calls)
+        return bool(self._tool_calls)
     
-    def _init_tool_arg_buffer(self, tool_call_id: str, initial_value: Optional[str]) -> None:
+    def _init_tool_arg_buffer(self, tool_call_id: str, initial_value: Any) -> None:
         """Initialize a tool argument buffer if not already present."""
-        if tool_call_id not in self.tool_args:
-            self.tool_args[tool_call_id] = initial_value or ""
+        if tool_call_id not in self._tool_args:
+            self._tool_args[tool_call_id] = initial_value
+
+    def _append_tool_args(self, fragment: Optional[str]) -> None:
+        """Buffer an argument fragment for the current tool call."""
+        if not fragment:
+            return
+        tool_call_id = self.current_tool_call["id"]
+        if not isinstance(self._tool_args.get(tool_call_id, ""), str):
+            # The call arrived with complete (dict) arguments; don't overwrite them
+            return
+        self._tool_arg_parts.setdefault(tool_call_id, []).append(fragment)
+
+    def _join_tool_args(self) -> None:
+        """Join fragments buffered since the last read into the tool calls."""
+        for tool_call_id, parts in self._tool_arg_parts.items():
+            joined = "".join([self._tool_args.get(tool_call_id, ""), *parts])
+            self._tool_args[tool_call_id] = joined
+            tool_call = self._tool_calls_by_id.get(tool_call_id)
+            if tool_call is not None:
+                tool_call["function"]["arguments"] = joined
+        self._tool_arg_parts.clear()
     
+    def _start_tool_call(self, tool_call_id: str, name: str, arguments: str) -> None:
+        """Make the tool call with this id current, registering it on first sight.
+
+        A repeated id re-selects the existing entry instead of adding a duplicate.
+        """
+        existing = self._tool_calls_by_id.get(tool_call_id)
+        if existing is not None:
+            self.current_tool_call = existing
+            return
+        self.current_tool_call = {
+            "id": tool_call_id,
+            "type": "function",
+            "function": {
+                "name": name,
+                "arguments": arguments,
+            },
+        }
+        self._init_tool_arg_buffer(tool_call_id, arguments)
+        self._tool_calls_by_id[tool_call_id] = self.current_tool_call
+        self._tool_calls.append(self.current_tool_call)
+
     def process_tool_call_delta(self, tool_call: Any) -> None:
         """Process a tool call delta from a streaming chunk.
         
@@ -124,72 +196,67 @@ class ChunkAccumulator:
     
     def _process_dict_tool_call(self, tool_call: Dict[str, Any]) -> None:
         """Process a tool call in dict format."""
-        if "id" in tool_call and tool_call["id"]:
-            self.current_tool_call = {
-                "id": str(tool_call["id"]),
-                "type": "function",
-                "function": {
-                    "name": tool_call.get("function", {}).get("name", ""),
-                    "arguments": tool_call.get("function", {}).get("arguments", "") or "",
-                },
-            }
-            self._init_tool_arg_buffer(
-                self.current_tool_call["id"],
-                self.current_tool_call["function"]["arguments"],
+        # Look up the id and function payload once per delta.
+        tool_call_id = tool_call.get("id")
+        function = tool_call.get("function")
+        if tool_call_id:
+            function = function or {}
+            self._start_tool_call(
+                str(tool_call_id),
+                function.get("name", ""),
+                function.get("arguments", "") or "",
             )
-            if self.current_tool_call not in self.tool_calls:
-                self.tool_calls.append(self.current_tool_call)
-        elif self.current_tool_call and "function" in tool_call:
-            if "name" in tool_call["function"] and tool_call["function"]["name"]:
-                self.current_tool_call["function"]["name"] = tool_call["function"]["name"]
-            if "arguments" in tool_call["function"]:
-                buf_id = self.current_tool_call["id"]
-                self.tool_args.setdefault(buf_id, "")
-                self.tool_args[buf_id] += tool_call["function"]["arguments"] or ""
-                self.current_tool_call["function"]["arguments"] = self.tool_args[buf_id]
+        elif self.current_tool_call and function is not None:
+            name = function.get("name")
+            if name:
+                self.current_tool_call["function"]["name"] = name
+            if "arguments" in function:
+                self._append_tool_args(function["arguments"])
     
     def _process_object_tool_call(self, tool_call: Any) -> None:
         """Process a tool call in object format."""
-        if hasattr(tool_call, "id") and tool_call.id:
-            self.current_tool_call = {
-                "id": str(tool_call.id),
-                "type": "function",
-                "function": {
-                    "name": getattr(tool_call.function, "name", ""),
-                    "arguments": getattr(tool_call.function, "arguments", "") or "",
-                },
-            }
-            self._init_tool_arg_buffer(
-                self.current_tool_call["id"],
-                self.current_tool_call["function"]["arguments"],
+        # Each attribute is read once (getattr default / EAFP) rather than hasattr + access,
+        # since this runs for every tool-call delta in the stream.
+        tool_call_id = getattr(tool_call, "id", None)
+        if tool_call_id:
+            function = tool_call.function
+            self._start_tool_call(
+                str(tool_call_id),
+                getattr(function, "name", ""),
+                getattr(function, "arguments", "") or "",
             )
-            if self.current_tool_call not in self.tool_calls:
-                self.tool_calls.append(self.current_tool_call)
-        elif self.current_tool_call and hasattr(tool_call, "function"):
-            if hasattr(tool_call.function, "name") and tool_call.function.name:
-                self.current_tool_call["function"]["name"] = tool_call.function.name
-            if hasattr(tool_call.function, "arguments"):
-                buf_id = self.current_tool_call["id"]
-                self.tool_args.setdefault(buf_id, "")
-                self.tool_args[buf_id] += getattr(tool_call.function, "arguments", "") or ""
-                self.current_tool_call["function"]["arguments"] = self.tool_args[buf_id]
+        elif self.current_tool_call:
+            function = getattr(tool_call, "function", None)
+            if function is None:
+                return
+            name = getattr(function, "name", None)
+            if name:
+                self.current_tool_call["function"]["name"] = name
+            try:
+                arguments = function.arguments
+            except AttributeError:
+                return
+            self._append_tool_args(arguments)
     
     def process_usage(self, chunk: Any) -> None:
         """Extract usage information from a chunk if present."""
-        if hasattr(chunk, "usage") and chunk.usage:
+        usage = getattr(chunk, "usage", None)
+        if usage:
             self.metrics["usage"] = {
-                "completion_tokens": getattr(chunk.usage, "completion_tokens", 0),
-                "prompt_tokens": getattr(chunk.usage, "prompt_tokens", 0),
-                "total_tokens": getattr(chunk.usage, "total_tokens", 0),
+                "completion_tokens": getattr(usage, "completion_tokens", 0),
+                "prompt_tokens": getattr(usage, "prompt_tokens", 0),
+                "total_tokens": getattr(usage, "total_tokens", 0),
             }
     
     def reset(self) -> None:
         """Reset the accumulator for a new step."""
         self.content.clear()
         self.thinking.clear()
-        self.tool_calls.clear()
         self.current_tool_call = None
-        self.tool_args.clear()
+        self._tool_calls.clear()
+        self._tool_calls_by_id.clear()
+        self._tool_args.clear()
+        self._tool_arg_parts.clear()
         self.metrics.clear()
 
 
@@ -202,10 +269,13 @@ def extract_thinking_content(delta: Any) -> tuple[Optional[str], Optional[str]]:
     Returns:
         Tuple of (thinking_content, thinking_type) or (None, None) if not present
     """
-    if hasattr(delta, "reasoning_content") and delta.reasoning_content is not None:
-        return str(delta.reasoning_content), "reasoning"
-    elif hasattr(delta, "thinking") and delta.thinking is not None:
-        return str(delta.thinking), "thinking"
-    elif hasattr(delta, "extended_thinking") and delta.extended_thinking is not None:
-        return str(delta.extended_thinking), "extended_thinking"
+    reasoning_content = getattr(delta, "reasoning_content", None)
+    if reasoning_content is not None:
+        return str(reasoning_content), "reasoning"
+    thinking = getattr(delta, "thinking", None)
+    if thinking is not None:
+        return str(thinking), "thinking"
+    extended_thinking = getattr(delta, "extended_thinking", None)
+    if extended_thinking is not None:
+        return str(extended_thinking), "extended_thinking"
     return None, None
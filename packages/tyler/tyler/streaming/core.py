@@ -14,8 +14,10 @@ Streaming *modes* (events/openai/vercel) should only be responsible for formatti
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import logging
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, Literal, Optional
@@ -23,12 +25,15 @@ from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, Literal, Optional
 from narrator import Message
 
 from tyler.models.execution import EventType, ExecutionEvent
+from tyler.models.tool_call import loads_tool_arguments
 from tyler.streaming.base import ChunkAccumulator, extract_thinking_content
 
 if TYPE_CHECKING:
     from tyler.models.agent import Agent
     from tyler.models.thread import Thread
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True)
 class StepSignal:
@@ -38,17 +43,107 @@ class StepSignal:
     value: Any
 
 
+class _ChunkEventBatcher:
+    """Coalesce consecutive content/thinking deltas into fewer chunk events.
+
+    Deltas of the same kind are buffered until ``batch_size`` of them have
+    arrived; a change of kind (or thinking type) flushes the buffer first so
+    event order matches the provider's stream.
+    """
+
+    def __init__(self, batch_size: int = 1):
+        self.batch_size = batch_size
+        self._parts: list[str] = []
+        self._kind: Optional[tuple[EventType, Optional[str]]] = None
+
+    def add(self, event_type: EventType, text: str, thinking_type: Optional[str] = None) -> list[StepSignal]:
+        """Buffer a delta, returning any events that are ready to emit."""
+        kind = (event_type, thinking_type)
+        signals = self.flush() if self._kind is not None and self._kind != kind else []
+        self._kind = kind
+        self._parts.append(text)
+        if len(self._parts) >= self.batch_size:
+            signals.extend(self.flush())
+        return signals
+
+    def flush(self) -> list[StepSignal]:
+        """Emit buffered text as a single event (or nothing if the buffer is empty)."""
+        if self._kind is None:
+            return []
+        event_type, thinking_type = self._kind
+        text = "".join(self._parts)
+        self._parts.clear()
+        self._kind = None
+        if event_type == EventType.LLM_STREAM_CHUNK:
+            data = {"content_chunk": text}
+        else:
+            data = {"thinking_chunk": text, "thinking_type": thinking_type}
+        return [
+            StepSignal(
+                kind="event",
+                value=ExecutionEvent(type=event_type, timestamp=datetime.now(timezone.utc), data=data),
+            )
+        ]
+
+
+class StreamThreadSaver:
+    """Persists the thread for one stream, keeping background saves in order.
+
+    Each ``stream()`` call creates its own saver and passes it to every step, so
+    concurrent streams on one agent never share (or overwrite) a pending save.
+
+    Attributes:
+        agent: The Agent whose thread store receives the saves
+        background: Whether intermediate saves may run in the background
+    """
+
+    def __init__(self, agent: "Agent", background: bool = False):
+        self.agent = agent
+        self.background = background
+        self._pending: Optional[asyncio.Task] = None
+
+    async def save(self, thread: "Thread", intermediate: bool = False) -> None:
+        """Save the thread.
+
+        Intermediate saves (between tool iterations) run in the background when
+        ``background`` is set; any other save first waits for the outstanding
+        background save so writes reach the store in order.
+        """
+        if intermediate and self.background:
+            self._pending = await self.agent._save_thread_in_background(thread, self._pending)
+            return
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            await pending
+        await self.agent.thread_store.save(thread)
+
+    def cancel(self) -> None:
+        """Cancel the outstanding background save, if any.
+
+        Called when a stream ends without reaching a final save, so the pending
+        save doesn't outlive it.
+        """
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            pending.cancel()
+
+
 async def execute_streaming_step(
     agent: "Agent",
     thread: "Thread",
+    saver: Optional[StreamThreadSaver] = None,
 ) -> AsyncGenerator[StepSignal, None]:
     """Execute a single streaming step/turn.
 
+    Args:
+      saver: The calling stream's thread saver. Without one, every save is awaited.
+
     Yields:
       - StepSignal(kind="chunk", value=<raw litellm chunk>)
       - StepSignal(kind="event", value=<ExecutionEvent>)
     """
-    logger = logging.getLogger(__name__)
+    if saver is None:
+        saver = StreamThreadSaver(agent)
 
     # Reset per-step flags
     agent._last_step_stream_had_tool_calls = False
@@ -93,7 +188,7 @@ async def execute_streaming_step(
             ),
         )
         if agent.thread_store:
-            await agent.thread_store.save(thread)
+            await saver.save(thread)
         agent._last_step_stream_had_tool_calls = False
         agent._last_step_stream_should_continue = False
         return
@@ -120,13 +215,14 @@ async def execute_streaming_step(
             ),
         )
         if agent.thread_store:
-            await agent.thread_store.save(thread)
+            await saver.save(thread)
         agent._last_step_stream_had_tool_calls = False
         agent._last_step_stream_should_continue = False
         return
 
     accumulator = ChunkAccumulator()
     accumulator.metrics = metrics
+    chunk_batcher = _ChunkEventBatcher(agent.stream_chunk_batch_size)
 
     # Stream chunks + derive events
     try:
@@ -134,45 +230,45 @@ async def execute_streaming_step(
             # Always expose the raw chunk to modes that want it
             yield StepSignal(kind="chunk", value=chunk)
 
-            if not hasattr(chunk, "choices") or not chunk.choices:
+            # Each delta attribute is read once with a getattr default; provider
+            # deltas don't all carry the same attributes, so there is no fixed shape.
+            choices = getattr(chunk, "choices", None)
+            if not choices:
                 continue
 
-            delta = chunk.choices[0].delta
+            delta = choices[0].delta
 
             # Content events
-            if hasattr(delta, "content") and delta.content is not None:
-                accumulator.add_content(delta.content)
-                yield StepSignal(
-                    kind="event",
-                    value=ExecutionEvent(
-                        type=EventType.LLM_STREAM_CHUNK,
-                        timestamp=datetime.now(timezone.utc),
-                        data={"content_chunk": delta.content},
-                    ),
-                )
+            content = getattr(delta, "content", None)
+            if content is not None:
+                accumulator.add_content(content)
+                for signal in chunk_batcher.add(EventType.LLM_STREAM_CHUNK, content):
+                    yield signal
 
             # Thinking events
             thinking_content, thinking_type = extract_thinking_content(delta)
             if thinking_content:
                 accumulator.add_thinking(thinking_content)
-                yield StepSignal(
-                    kind="event",
-                    value=ExecutionEvent(
-                        type=EventType.LLM_THINKING_CHUNK,
-                        timestamp=datetime.now(timezone.utc),
-                        data={"thinking_chunk": thinking_content, "thinking_type": thinking_type},
-                    ),
-                )
+                for signal in chunk_batcher.add(EventType.LLM_THINKING_CHUNK, thinking_content, thinking_type):
+                    yield signal
 
             # Tool call deltas
-            if hasattr(delta, "tool_calls") and delta.tool_calls:
-                for tool_call in delta.tool_calls:
+            tool_call_deltas = getattr(delta, "tool_calls", None)
+            if tool_call_deltas:
+                for signal in chunk_batcher.flush():
+                    yield signal
+                for tool_call in tool_call_deltas:
                     accumulator.process_tool_call_delta(tool_call)
 
             # Usage updates
             accumulator.process_usage(chunk)
 
+        for signal in chunk_batcher.flush():
+            yield signal
+
     except Exception as e:
+        for signal in chunk_batcher.flush():
+            yield signal
         error_msg = f"Stream error: {str(e)}"
         logger.error(error_msg)
         yield StepSignal(
@@ -194,7 +290,7 @@ async def execute_streaming_step(
             ),
         )
         if agent.thread_store:
-            await agent.thread_store.save(thread)
+            await saver.save(thread)
         agent._last_step_stream_had_tool_calls = False
         agent._last_step_stream_should_continue = False
         return
@@ -252,66 +348,98 @@ async def execute_streaming_step(
     # No tools => done
     if not accumulator.has_tool_calls():
         if agent.thread_store:
-            await agent.thread_store.save(thread)
+            await saver.save(thread)
         agent._last_step_stream_had_tool_calls = False
         agent._last_step_stream_should_continue = False
         return
 
     agent._last_step_stream_had_tool_calls = True
 
-    # TOOL_SELECTED events + parse args for tool execution
+    # Tools run concurrently (bounded by max_parallel_tools) with duration tracking
+    tool_durations_ms: Dict[str, float] = {}
+    semaphore = agent._new_tool_semaphore()
+
+    async def _run_tool(tool_call: Dict[str, Any], tool_call_id: str) -> Any:
+        async with semaphore if semaphore is not None else contextlib.nullcontext():
+            start = time.perf_counter_ns()
+            try:
+                return await agent._handle_tool_execution(tool_call)
+            finally:
+                tool_durations_ms[tool_call_id] = (time.perf_counter_ns() - start) / 1e6
+
+    # Parse args, start each tool, then emit its TOOL_SELECTED event. Starting the task
+    # first lets tools run while the consumer is still handling the selection events.
     parsed_tool_calls = []
-    for tool_call in accumulator.tool_calls:
-        tool_name = tool_call["function"]["name"]
-        tool_call_id = tool_call["id"]
-        args_raw = tool_call["function"]["arguments"]
-        try:
-            if isinstance(args_raw, str) and args_raw.strip():
-                args_dict = json.loads(args_raw)
-            elif isinstance(args_raw, dict):
-                args_dict = args_raw
-            else:
+    tool_tasks: list[asyncio.Task] = []
+    try:
+        for tool_call in accumulator.tool_calls:
+            tool_name = tool_call["function"]["name"]
+            tool_call_id = tool_call["id"]
+            args_raw = tool_call["function"]["arguments"]
+            args_are_json = False
+            try:
+                if isinstance(args_raw, str) and args_raw.strip():
+                    args_dict = loads_tool_arguments(args_raw)
+                    args_are_json = True
+                elif isinstance(args_raw, dict):
+                    args_dict = args_raw
+                else:
+                    args_dict = {}
+            except json.JSONDecodeError:
                 args_dict = {}
-        except json.JSONDecodeError:
-            args_dict = {}
 
-        # Normalize stored arguments to JSON string (consistent with existing behavior)
-        tool_call["function"]["arguments"] = json.dumps(args_dict)
-        parsed_tool_calls.append((tool_call, tool_name, tool_call_id, args_dict))
+            # Normalize stored arguments to a JSON string; a string that already parsed is kept as-is
+            if not args_are_json:
+                tool_call["function"]["arguments"] = json.dumps(args_dict)
+            parsed_tool_calls.append((tool_call, tool_name, tool_call_id, args_dict))
+            tool_tasks.append(asyncio.create_task(_run_tool(tool_call, tool_call_id)))
 
-        yield StepSignal(
-            kind="event",
-            value=ExecutionEvent(
-                type=EventType.TOOL_SELECTED,
-                timestamp=datetime.now(timezone.utc),
-                data={
-                    "tool_name": tool_name,
-                    "tool_call_id": tool_call_id,
-                    "arguments": args_dict,
-                },
-            ),
-        )
+            yield StepSignal(
+                kind="event",
+                value=ExecutionEvent(
+                    type=EventType.TOOL_SELECTED,
+                    timestamp=datetime.now(timezone.utc),
+                    data={
+                        "tool_name": tool_name,
+                        "tool_call_id": tool_call_id,
+                        "arguments": args_dict,
+                    },
+                ),
+            )
+    except BaseException:
+        # Consumer stopped iterating (or parsing failed): don't leave tools running unobserved
+        for task in tool_tasks:
+            task.cancel()
+        raise
+
+    async def _indexed_result(index: int, task: asyncio.Task) -> tuple[int, Any]:
+        try:
+            return index, await task
+        except Exception as tool_exc:
+            return index, tool_exc
+
+    # Results are reported as tools finish, but tool messages join the thread in
+    # request order so the persisted thread (and the next prompt) is deterministic
+    tool_messages: list[Optional[Message]] = [None] * len(tool_tasks)
 
-    # Execute tools in parallel with duration tracking
-    tool_start_times: Dict[str, datetime] = {}
-    tool_tasks = []
-    for tool_call, tool_name, tool_call_id, _args_dict in parsed_tool_calls:
-        tool_start_times[tool_call_id] = datetime.now(timezone.utc)
-        tool_tasks.append(agent._handle_tool_execution(tool_call))
+    def _add_tool_messages() -> None:
+        for tool_message in tool_messages:
+            if tool_message is not None:
+                thread.add_message(tool_message)
+        tool_messages[:] = []
 
     should_break = False
     try:
-        tool_results = await asyncio.gather(*tool_tasks, return_exceptions=True)
-
-        for i, result in enumerate(tool_results):
+        # Report each tool as soon as it finishes rather than after the slowest one
+        for next_done in asyncio.as_completed(
+            [_indexed_result(i, task) for i, task in enumerate(tool_tasks)]
+        ):
+            i, result = await next_done
             tool_call, tool_name, tool_call_id, _args_dict = parsed_tool_calls[i]
-            tool_end_time = datetime.now(timezone.utc)
-            duration_ms = (
-                tool_end_time - tool_start_times[tool_call_id]
-            ).total_seconds() * 1000
+            duration_ms = tool_durations_ms.get(tool_call_id, 0.0)
 
             tool_message, break_iteration = agent._process_tool_result(result, tool_call, tool_name)
-            thread.add_message(tool_message)
+            tool_messages[i] = tool_message
 
             if isinstance(result, Exception):
                 yield StepSignal(
@@ -354,10 +482,13 @@ async def execute_streaming_step(
             if break_iteration:
                 should_break = True
 
+        _add_tool_messages()
         if agent.thread_store:
-            await agent.thread_store.save(thread)
+            # Another step follows unless a tool asked to stop, so this save is intermediate
+            await saver.save(thread, intermediate=not should_break)
 
     except Exception as e:
+        _add_tool_messages()
         error_msg = f"Tool execution failed: {str(e)}"
         logger.error(error_msg)
         yield StepSignal(
@@ -379,7 +510,11 @@ async def execute_streaming_step(
             ),
         )
         if agent.thread_store:
-            await agent.thread_store.save(thread)
+            await saver.save(thread)
         should_break = True
+    finally:
+        # No-op once every tool has finished; stops stragglers if the consumer stops early
+        for task in tool_tasks:
+            task.cancel()
 
     agent._last_step_stream_should_continue = accumulator.has_tool_calls() and not should_break
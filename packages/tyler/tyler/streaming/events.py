@@ -3,13 +3,14 @@
 This module provides the EventsStreamMode which yields ExecutionEvent objects
 with detailed telemetry about agent execution.
 """
+import time
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, AsyncGenerator
+from typing import TYPE_CHECKING, AsyncGenerator, Optional
 
 from tyler.models.execution import ExecutionEvent, EventType
 from narrator import Message
 from tyler.streaming.base import BaseStreamMode
-from tyler.streaming.core import execute_streaming_step
+from tyler.streaming.core import StreamThreadSaver, execute_streaming_step
 
 if TYPE_CHECKING:
     from tyler.models.agent import Agent
@@ -43,69 +44,75 @@ class EventsStreamMode(BaseStreamMode):
         """
         agent._iteration_count = 0
         agent._tool_attributes_cache.clear()
-        start_time = datetime.now(timezone.utc)
+        saver = StreamThreadSaver(agent, background=agent.background_thread_saves)
+        start_ns = time.perf_counter_ns()
         total_tokens = 0
 
-        while agent._iteration_count < agent.max_tool_iterations:
-            # Yield iteration start event
-            yield ExecutionEvent(
-                type=EventType.ITERATION_START,
-                timestamp=datetime.now(timezone.utc),
-                data={
-                    "iteration_number": agent._iteration_count,
-                    "max_iterations": agent.max_tool_iterations,
-                },
-            )
+        try:
+            while agent._iteration_count < agent.max_tool_iterations:
+                # Yield iteration start event
+                yield ExecutionEvent(
+                    type=EventType.ITERATION_START,
+                    timestamp=datetime.now(timezone.utc),
+                    data={
+                        "iteration_number": agent._iteration_count,
+                        "max_iterations": agent.max_tool_iterations,
+                    },
+                )
 
-            # Execute one step via agent.step_stream for proper Weave tracing
-            async for event in agent.step_stream(thread, mode="events"):
-                if event.type == EventType.LLM_RESPONSE:
-                    toks = (event.data or {}).get("tokens") or {}
-                    if isinstance(toks, dict):
-                        total_tokens += int(toks.get("total_tokens", 0) or 0)
-                yield event
+                # Execute one step via agent.step_stream for proper Weave tracing
+                async for event in agent.step_stream(thread, mode="events", saver=saver):
+                    if event.type == EventType.LLM_RESPONSE:
+                        toks = (event.data or {}).get("tokens") or {}
+                        if isinstance(toks, dict):
+                            total_tokens += int(toks.get("total_tokens", 0) or 0)
+                    yield event
 
-            if not agent._last_step_stream_should_continue:
-                break
+                if not agent._last_step_stream_should_continue:
+                    break
 
-            agent._iteration_count += 1
+                agent._iteration_count += 1
 
-        # Handle max iterations limit
-        if agent._iteration_count >= agent.max_tool_iterations:
-            message = agent.message_factory.create_max_iterations_message()
-            thread.add_message(message)
-            yield ExecutionEvent(
-                type=EventType.MESSAGE_CREATED,
-                timestamp=datetime.now(timezone.utc),
-                data={"message": message},
-            )
+            # Handle max iterations limit
+            if agent._iteration_count >= agent.max_tool_iterations:
+                message = agent.message_factory.create_max_iterations_message()
+                thread.add_message(message)
+                yield ExecutionEvent(
+                    type=EventType.MESSAGE_CREATED,
+                    timestamp=datetime.now(timezone.utc),
+                    data={"message": message},
+                )
+                yield ExecutionEvent(
+                    type=EventType.ITERATION_LIMIT,
+                    timestamp=datetime.now(timezone.utc),
+                    data={"iterations_used": agent._iteration_count},
+                )
+                if agent.thread_store:
+                    await saver.save(thread)
+
+            # Emit execution complete
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
             yield ExecutionEvent(
-                type=EventType.ITERATION_LIMIT,
+                type=EventType.EXECUTION_COMPLETE,
                 timestamp=datetime.now(timezone.utc),
-                data={"iterations_used": agent._iteration_count},
+                data={"duration_ms": duration_ms, "total_tokens": total_tokens},
             )
-            if agent.thread_store:
-                await agent.thread_store.save(thread)
-
-        # Emit execution complete
-        duration_ms = (datetime.now(timezone.utc) - start_time).total_seconds() * 1000
-        yield ExecutionEvent(
-            type=EventType.EXECUTION_COMPLETE,
-            timestamp=datetime.now(timezone.utc),
-            data={"duration_ms": duration_ms, "total_tokens": total_tokens},
-        )
+        finally:
+            # Don't leave a background save running if the stream is closed, cancelled or fails
+            saver.cancel()
 
     async def _step_stream(
         self,
         agent: "Agent",
         thread: "Thread",
+        saver: Optional[StreamThreadSaver] = None,
     ) -> AsyncGenerator[ExecutionEvent, None]:
         """Execute a single streaming step and yield ExecutionEvents.
 
         This delegates all LLM/tool mechanics to the canonical executor and simply
         filters to `ExecutionEvent` yields.
         """
-        async for signal in execute_streaming_step(agent, thread):
+        async for signal in execute_streaming_step(agent, thread, saver):
             if signal.kind == "event":
                 yield signal.value
 
@@ -4,15 +4,17 @@ This module provides the OpenAIStreamMode which yields raw LiteLLM chunks
 in OpenAI-compatible format for direct integration with OpenAI clients.
 """
 import logging
-from typing import TYPE_CHECKING, Any, AsyncGenerator
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Optional
 
 from tyler.streaming.base import BaseStreamMode
-from tyler.streaming.core import execute_streaming_step
+from tyler.streaming.core import StreamThreadSaver, execute_streaming_step
 
 if TYPE_CHECKING:
     from tyler.models.agent import Agent
     from narrator import Thread
 
+logger = logging.getLogger(__name__)
+
 
 class OpenAIStreamMode(BaseStreamMode):
     """Streaming mode that yields raw LiteLLM chunks.
@@ -46,38 +48,44 @@ class OpenAIStreamMode(BaseStreamMode):
         """
         agent._iteration_count = 0
         agent._tool_attributes_cache.clear()
+        saver = StreamThreadSaver(agent, background=agent.background_thread_saves)
 
-        while agent._iteration_count < agent.max_tool_iterations:
-            # Execute one step via agent.step_stream for proper Weave tracing
-            async for chunk in agent.step_stream(thread, mode="openai"):
-                yield chunk
+        try:
+            while agent._iteration_count < agent.max_tool_iterations:
+                # Execute one step via agent.step_stream for proper Weave tracing
+                async for chunk in agent.step_stream(thread, mode="openai", saver=saver):
+                    yield chunk
 
-            if not agent._last_step_stream_should_continue:
-                break
+                if not agent._last_step_stream_should_continue:
+                    break
 
-            agent._iteration_count += 1
+                agent._iteration_count += 1
 
-        # Handle max iterations limit (no events in openai mode)
-        if agent._iteration_count >= agent.max_tool_iterations:
-            logging.getLogger(__name__).warning(
-                f"Hit max iterations ({agent.max_tool_iterations})"
-            )
-            message = agent.message_factory.create_max_iterations_message()
-            thread.add_message(message)
-            if agent.thread_store:
-                await agent.thread_store.save(thread)
+            # Handle max iterations limit (no events in openai mode)
+            if agent._iteration_count >= agent.max_tool_iterations:
+                logger.warning(
+                    f"Hit max iterations ({agent.max_tool_iterations})"
+                )
+                message = agent.message_factory.create_max_iterations_message()
+                thread.add_message(message)
+                if agent.thread_store:
+                    await saver.save(thread)
+        finally:
+            # Don't leave a background save running if the stream is closed, cancelled or fails
+            saver.cancel()
 
     async def _step_stream(
         self,
         agent: "Agent",
         thread: "Thread",
+        saver: Optional[StreamThreadSaver] = None,
     ) -> AsyncGenerator[Any, None]:
         """Execute a single streaming step yielding only raw chunks.
 
         All tool execution + thread updates happen in the canonical executor; this
         mode simply forwards raw chunks.
         """
-        async for signal in execute_streaming_step(agent, thread):
+        async for signal in execute_streaming_step(agent, thread, saver):
             if signal.kind == "chunk":
                 yield signal.value
 
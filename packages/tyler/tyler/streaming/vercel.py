@@ -5,10 +5,11 @@ compatible with the Vercel AI SDK's useChat hook.
 
 Protocol reference: https://ai-sdk.dev/docs/ai-sdk-ui/stream-protocol#data-stream-protocol
 """
-from typing import TYPE_CHECKING, AsyncGenerator
+from typing import TYPE_CHECKING, AsyncGenerator, Optional
 
 from tyler.models.execution import EventType
 from tyler.streaming.base import BaseStreamMode
+from tyler.streaming.core import StreamThreadSaver
 from tyler.streaming.vercel_protocol import VercelStreamFormatter, FinishReason
 
 if TYPE_CHECKING:
@@ -59,39 +60,45 @@ class VercelStreamMode(BaseStreamMode):
         # Per-run orchestration, step by step (turns)
         agent._iteration_count = 0
         agent._tool_attributes_cache.clear()
-
-        while agent._iteration_count < agent.max_tool_iterations:
-            async for sse in agent.step_stream(thread, mode="vercel"):
-                yield sse
-
-            if not agent._last_step_stream_should_continue:
-                break
-
-            agent._iteration_count += 1
-
-        # If we hit max iterations, persist + stream a max-iterations message as a final step
-        if agent._iteration_count >= agent.max_tool_iterations:
-            message = agent.message_factory.create_max_iterations_message()
-            thread.add_message(message)
-            if agent.thread_store:
-                await agent.thread_store.save(thread)
-
-            # Stream it as a final step-local text block
-            yield formatter.format_step_start()
-            yield formatter.format_text_start()
-            if message.content:
-                yield formatter.format_text_delta(message.content)
-            yield formatter.format_text_end()
-            yield formatter.format_step_finish()
-
-        # Message finish + done marker
-        yield formatter.format_finish(FinishReason.STOP)
-        yield formatter.format_done()
+        saver = StreamThreadSaver(agent, background=agent.background_thread_saves)
+
+        try:
+            while agent._iteration_count < agent.max_tool_iterations:
+                async for sse in agent.step_stream(thread, mode="vercel", saver=saver):
+                    yield sse
+
+                if not agent._last_step_stream_should_continue:
+                    break
+
+                agent._iteration_count += 1
+
+            # If we hit max iterations, persist + stream a max-iterations message as a final step
+            if agent._iteration_count >= agent.max_tool_iterations:
+                message = agent.message_factory.create_max_iterations_message()
+                thread.add_message(message)
+                if agent.thread_store:
+                    await saver.save(thread)
+
+                # Stream it as a final step-local text block
+                yield formatter.format_step_start()
+                yield formatter.format_text_start()
+                if message.content:
+                    yield formatter.format_text_delta(message.content)
+                yield formatter.format_text_end()
+                yield formatter.format_step_finish()
+
+            # Message finish + done marker
+            yield formatter.format_finish(FinishReason.STOP)
+            yield formatter.format_done()
+        finally:
+            # Don't leave a background save running if the stream is closed, cancelled or fails
+            saver.cancel()
 
     async def _step_stream(
         self,
         agent: "Agent",
         thread: "Thread",
+        saver: Optional[StreamThreadSaver] = None,
     ) -> AsyncGenerator[str, None]:
         """Stream a single agent step as Vercel AI SDK SSE strings.
 
@@ -115,7 +122,7 @@ class VercelStreamMode(BaseStreamMode):
         text_open = False
         reasoning_open = False
 
-        async for event in events_stream_mode._step_stream(agent, thread):
+        async for event in events_stream_mode._step_stream(agent, thread, saver):
             if event.type == EventType.LLM_THINKING_CHUNK:
                 if not reasoning_open:
                     yield formatter.format_reasoning_start()
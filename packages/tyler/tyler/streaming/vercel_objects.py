@@ -11,6 +11,7 @@ import uuid
 
 from tyler.models.execution import EventType
 from tyler.streaming.base import BaseStreamMode
+from tyler.streaming.core import StreamThreadSaver
 from tyler.streaming.vercel_protocol import (
     FinishReason,
     TextStartChunk,
@@ -219,38 +220,44 @@ class VercelObjectsStreamMode(BaseStreamMode):
         # Per-run orchestration, step by step (turns)
         agent._iteration_count = 0
         agent._tool_attributes_cache.clear()
+        saver = StreamThreadSaver(agent, background=agent.background_thread_saves)
 
-        while agent._iteration_count < agent.max_tool_iterations:
-            async for chunk in agent.step_stream(thread, mode="vercel_objects"):
-                yield chunk
+        try:
+            while agent._iteration_count < agent.max_tool_iterations:
+                async for chunk in agent.step_stream(thread, mode="vercel_objects", saver=saver):
+                    yield chunk
 
-            if not agent._last_step_stream_should_continue:
-                break
+                if not agent._last_step_stream_should_continue:
+                    break
 
-            agent._iteration_count += 1
+                agent._iteration_count += 1
 
-        # If we hit max iterations, persist + stream a max-iterations message as a final step
-        if agent._iteration_count >= agent.max_tool_iterations:
-            message = agent.message_factory.create_max_iterations_message()
-            thread.add_message(message)
-            if agent.thread_store:
-                await agent.thread_store.save(thread)
+            # If we hit max iterations, persist + stream a max-iterations message as a final step
+            if agent._iteration_count >= agent.max_tool_iterations:
+                message = agent.message_factory.create_max_iterations_message()
+                thread.add_message(message)
+                if agent.thread_store:
+                    await saver.save(thread)
 
-            # Stream it as a final step-local text block
-            yield formatter.create_step_start()
-            yield formatter.create_text_start()
-            if message.content:
-                yield formatter.create_text_delta(message.content)
-            yield formatter.create_text_end()
-            yield formatter.create_step_finish()
+                # Stream it as a final step-local text block
+                yield formatter.create_step_start()
+                yield formatter.create_text_start()
+                if message.content:
+                    yield formatter.create_text_delta(message.content)
+                yield formatter.create_text_end()
+                yield formatter.create_step_finish()
 
-        # Message finish (no [DONE] marker for object mode)
-        yield formatter.create_finish(FinishReason.STOP)
+            # Message finish (no [DONE] marker for object mode)
+            yield formatter.create_finish(FinishReason.STOP)
+        finally:
+            # Don't leave a background save running if the stream is closed, cancelled or fails
+            saver.cancel()
 
     async def _step_stream(
         self,
         agent: "Agent",
         thread: "Thread",
+        saver: Optional[StreamThreadSaver] = None,
     ) -> AsyncGenerator[UIMessageChunk, None]:
         """Stream a single agent step as Vercel AI SDK chunk dictionaries.
 
@@ -271,7 +278,7 @@ class VercelObjectsStreamMode(BaseStreamMode):
         text_open = False
         reasoning_open = False
 
-        async for event in events_stream_mode._step_stream(agent, thread):
+        async for event in events_stream_mode._step_stream(agent, thread, saver):
             if event.type == EventType.LLM_THINKING_CHUNK:
                 if not reasoning_open:
                     yield formatter.create_reasoning_start()
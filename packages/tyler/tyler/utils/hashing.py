@@ -0,0 +1,37 @@
+"""Stable hashing of JSON data for cache keys."""
+from hashlib import blake2b
+from typing import Any, Optional
+import json
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def stable_json_hash(value: Any) -> Optional[str]:
+    """Return a hash of JSON data that doesn't depend on dict key order.
+
+    Returns None when the value holds anything that isn't plain JSON data
+    (arbitrary objects, datetimes, dataclasses, ...), since such values can't be
+    told apart reliably and callers should skip caching them.
+    """
+    payload = None
+    if HAS_ORJSON:
+        try:
+            payload = orjson.dumps(
+                value,
+                option=orjson.OPT_SORT_KEYS
+                | orjson.OPT_PASSTHROUGH_DATACLASS
+                | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        except TypeError:
+            # orjson rejects some inputs stdlib json accepts (e.g. ints > 64 bits)
+            pass
+    if payload is None:
+        try:
+            payload = json.dumps(value, sort_keys=True).encode("utf-8")
+        except (TypeError, ValueError):
+            return None
+    return blake2b(payload, digest_size=16).hexdigest()
@@ -11,6 +11,7 @@ from functools import wraps
 from dataclasses import dataclass, field
 from tyler.utils.logging import get_logger
 from tyler.models.execution import ToolContextError
+from tyler.models.tool_call import loads_tool_arguments
 # Direct import
 from narrator import Attachment
 import base64
@@ -218,6 +219,26 @@ class ToolRunner:
         """
         return self.tool_attributes.get(name)
         
+    def tool_uses_context(self, name: str) -> Optional[bool]:
+        """
+        Check whether a tool receives context injection.
+        
+        Args:
+            name: The name of the tool
+            
+        Returns:
+            True if the tool declares a required or optional context parameter,
+            False if it does not, None if the tool is not registered.
+        """
+        tool = self.tools.get(name)
+        if not tool or 'implementation' not in tool:
+            return None
+        implementation = tool['implementation']
+        return (
+            self._tool_expects_context(implementation)
+            or self._tool_accepts_optional_context(implementation)
+        )
+        
     def get_tool_definition(self, name: str) -> Optional[Dict[str, Any]]:
         """Get OpenAI function definition for a tool"""
         tool = self.tools.get(name)
@@ -695,7 +716,7 @@ class ToolRunner:
         
         # Parse arguments
         try:
-            arguments = json.loads(tool_call.function.arguments)
+            arguments = loads_tool_arguments(tool_call.function.arguments)
             logger.debug(f"Parsed arguments: {arguments}")
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in tool arguments: {e}")